@@ -0,0 +1,183 @@
+"""Benchmark the creator finder pipeline against the offline mock API.
+
+Times search_channels, get_channel_stats, get_recent_videos_stats_batch,
+find_creators_for_category and the export step at several corpus sizes, and
+records requests per second, API calls per accepted creator and peak memory.
+Results are written as JSON so runs can be compared between versions:
+
+    python benchmark_finder.py --sizes 1000 5000 20000 --latency 0.02 --output bench.json
+    python benchmark_finder.py --baseline bench.json --output bench_new.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import youtube_creator_finder as finder_module
+from mock_youtube_api import MockYouTubeAPI
+from youtube_creator_finder import CATEGORIES, TokenBucket, YouTubeCreatorFinder
+
+
+BENCH_CATEGORY = "VFX & Visual Effects Artists"
+
+
+def git_version():
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+class StageTimer:
+    """Measures wall time, mock API requests and peak traced memory for one stage"""
+
+    def __init__(self, api):
+        self.api = api
+        self.results = {}
+
+    @contextlib.contextmanager
+    def stage(self, name, quiet=True):
+        requests_before = self.api.stats()['total_requests']
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        result = {}
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext():
+            with contextlib.redirect_stderr(output) if quiet else contextlib.nullcontext():
+                yield result
+        seconds = time.perf_counter() - start
+        requests = self.api.stats()['total_requests'] - requests_before
+        result.update({
+            'seconds': round(seconds, 4),
+            'requests': requests,
+            'requests_per_second': round(requests / seconds, 1) if seconds else None,
+            'peak_memory_mb': round(tracemalloc.get_traced_memory()[1] / 1e6, 2)
+        })
+        self.results[name] = result
+
+
+def make_finder(api, args):
+    return YouTubeCreatorFinder(
+        "benchmark-key", max_workers=args.workers, api_base_url=api.base_url,
+        rate_limiter=TokenBucket(args.qps, args.qps), backend=args.backend
+    )
+
+
+def bench_corpus(size, args):
+    api = MockYouTubeAPI(channels=size, latency=args.latency, error_rate=args.error_rate, seed=args.seed)
+    api.start()
+    timer = StageTimer(api)
+    keywords = CATEGORIES[BENCH_CATEGORY]['keywords']
+    try:
+        finder = make_finder(api, args)
+
+        with timer.stage('search_channels') as result:
+            channel_ids = []
+            for keyword in keywords:
+                channel_ids.extend(c.channel_id for c in finder.search_channels(keyword, max_results=50))
+            channel_ids = list(dict.fromkeys(channel_ids))
+            result['channels'] = len(channel_ids)
+
+        with timer.stage('get_channel_stats') as result:
+            stats = finder.get_channel_stats(channel_ids)
+            result['channels'] = len(stats)
+
+        sample = dict(list(stats.items())[:args.video_sample])
+        with timer.stage('get_recent_videos_stats') as result:
+            videos = finder.get_recent_videos_stats_batch(sample)
+            result['channels'] = len(videos)
+        finder.close()
+
+        # A fresh finder so the category run starts with empty dedup state
+        finder = make_finder(api, args)
+        with timer.stage('find_creators_for_category') as result:
+            creators = finder.find_creators_for_category(BENCH_CATEGORY, CATEGORIES[BENCH_CATEGORY])
+            result['accepted'] = len(creators)
+        stage = timer.results['find_creators_for_category']
+        stage['api_calls_per_creator'] = round(stage['requests'] / len(creators), 2) if creators else None
+        stage['quota_units'] = finder.quota.total_units
+        finder.close()
+
+        # Export a larger synthetic result set so the export step is measurable
+        rows = [dict(c, **{'Channel ID': f"{c['Channel ID']}-{i}"})
+                for i in range(args.export_multiplier) for c in creators]
+        with tempfile.TemporaryDirectory() as tmp:
+            with timer.stage('export') as result:
+                finder.export(rows, os.path.join(tmp, 'bench.csv'))
+                result['rows'] = len(rows)
+    finally:
+        api.stop()
+
+    return {'corpus_size': size, 'stages': timer.results, 'mock_api': api.stats()}
+
+
+def compare(results, baseline):
+    """Print the per-stage time change against a baseline results file"""
+    base = {(r['corpus_size'], stage): data
+            for r in baseline['results'] for stage, data in r['stages'].items()}
+    print(f"\n📉 Compared with {baseline['version']} ({baseline['timestamp']}):")
+    for r in results:
+        for stage, data in r['stages'].items():
+            old = base.get((r['corpus_size'], stage))
+            if not old or not old['seconds']:
+                continue
+            change = (data['seconds'] - old['seconds']) / old['seconds'] * 100
+            flag = "⚠️ " if change > 10 else "  "
+            print(f"   {flag}{r['corpus_size']:>7} {stage:<28} {old['seconds']:>8.3f}s -> {data['seconds']:>8.3f}s ({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark youtube_creator_finder against the mock API")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000, 20000], help="corpus sizes")
+    parser.add_argument('--latency', type=float, default=0.01, help="mock API latency per request (s)")
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--backend', choices=["sync", "async"], default=finder_module.API_BACKEND)
+    parser.add_argument('--workers', type=int, default=finder_module.MAX_WORKERS)
+    parser.add_argument('--qps', type=float, default=1000, help="finder rate limit during the benchmark")
+    parser.add_argument('--video-sample', type=int, default=200, help="channels in the recent-videos stage")
+    parser.add_argument('--export-multiplier', type=int, default=50, help="copies of the found creators to export")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default="benchmark_results.json")
+    parser.add_argument('--baseline', help="earlier results file to compare against")
+    args = parser.parse_args()
+
+    # Fast retries so error-injection runs measure the pipeline, not the backoff
+    finder_module.RETRY_BASE_DELAY = 0.01
+
+    tracemalloc.start()
+    results = []
+    for size in args.sizes:
+        print(f"⏱️  Corpus of {size} channels...")
+        results.append(bench_corpus(size, args))
+        for stage, data in results[-1]['stages'].items():
+            print(f"   {stage:<28} {data['seconds']:>8.3f}s  {data['requests']:>6} req  "
+                  f"{data['requests_per_second'] or 0:>8.1f} req/s  {data['peak_memory_mb']:>7.2f} MB")
+
+    report = {
+        'version': git_version(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'config': {k: v for k, v in vars(args).items() if k not in ('output', 'baseline')},
+        'results': results
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n📁 Results: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
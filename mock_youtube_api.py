@@ -0,0 +1,395 @@
+"""Offline stand-in for the YouTube Data API endpoints used by youtube_creator_finder.py.
+
+Serves deterministic synthetic channels and videos for search.list, channels.list,
+playlistItems.list and videos.list, with configurable latency, error injection and
+per-key quota exhaustion. The same seed and corpus size always produce the same data,
+dated relative to when the corpus is created so recent-video windows see the same uploads
+whatever the day.
+
+    python mock_youtube_api.py --port 8080 --channels 5000 --latency 0.05
+
+then point the finder at it with API_BASE_URL = "http://127.0.0.1:8080/youtube/v3".
+The `fields` partial-response parameter is accepted but ignored. Responses carry
+ETags, and a request whose If-None-Match matches the current ETag gets a 304.
+"""
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+QUOTA_COSTS = {"search": 100, "channels": 1, "playlistItems": 1, "videos": 1}
+
+# Words channels are tagged with; search matches query words against them
+TOPICS = [
+    "ai", "tools", "review", "video", "generative", "tutorial", "chatgpt", "midjourney",
+    "stable", "diffusion", "runway", "creator", "editing", "automation", "filmmaker",
+    "filmmaking", "cinematography", "indie", "documentary", "camera", "cinematic",
+    "lighting", "color", "grading", "gimbal", "vlog", "vfx", "visual", "effects", "cgi",
+    "compositing", "blender", "nuke", "houdini", "after", "premiere", "davinci", "resolve",
+    "capcut", "post-production", "luts", "music", "producer", "lyric", "visualizer",
+    "digital", "art", "procreate", "illustration", "concept", "character", "design",
+    "motion", "graphics", "animation", "2d", "cinema", "4d", "typography", "logo"
+]
+ADJECTIVES = ["Creative", "Pixel", "Frame", "Studio", "Neon", "Epic", "Tiny", "Bold", "Lucid", "Prime"]
+NOUNS = ["Lab", "Works", "Academy", "Films", "Motion", "Arts", "Hub", "Craft", "Vision", "Edits"]
+COUNTRIES = ["US", "GB", "CA", "IN", "DE", "BR", "AU", "FR", "Unknown"]
+
+MAX_SEARCH_RESULTS = 500
+
+
+def _iso(dt):
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _etag(resource):
+    return hashlib.sha1(json.dumps(resource, sort_keys=True).encode('utf-8')).hexdigest()[:27]
+
+
+class SyntheticCorpus:
+    """Deterministic channels and videos; everything is derived from (seed, index).
+
+    Publish dates count back from reference_date, by default the time the corpus is created.
+    """
+
+    def __init__(self, channels=1000, videos_per_channel=30, seed=0, reference_date=None):
+        self.size = channels
+        self.videos_per_channel = videos_per_channel
+        self.seed = seed
+        self.reference_date = reference_date or datetime.now(timezone.utc)
+        self._channels = {}
+        self._lock = threading.Lock()
+        self._topic_index = {}
+        for i in range(channels):
+            for topic in self.channel(i)['topics']:
+                self._topic_index.setdefault(topic, []).append(i)
+
+    def channel_id(self, index):
+        suffix = hashlib.sha1(f"{self.seed}:{index}".encode()).hexdigest()[:14]
+        return f"UC{index:08d}{suffix}"
+
+    def channel_index(self, channel_id):
+        try:
+            index = int(channel_id[2:10])
+        except ValueError:
+            return None
+        if 0 <= index < self.size and channel_id == self.channel_id(index):
+            return index
+        return None
+
+    def channel(self, index):
+        with self._lock:
+            if index in self._channels:
+                return self._channels[index]
+
+        rng = random.Random(f"{self.seed}:channel:{index}")
+        subscribers = int(10 ** rng.uniform(2.5, 7))
+        # Average views as a share of subscribers; some channels are dormant
+        view_ratio = 10 ** rng.uniform(-3.5, -0.3) if rng.random() > 0.1 else 0.0005
+        topics = rng.sample(TOPICS, 4)
+        business = rng.random() < 0.4
+        channel = {
+            'id': self.channel_id(index),
+            'title': f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {index}",
+            'topics': topics,
+            'subscribers': subscribers,
+            'avg_views': max(1, int(subscribers * view_ratio)),
+            'upload_interval_days': rng.choice([1, 2, 3, 7, 14, 30, 90]),
+            'country': rng.choice(COUNTRIES),
+            'custom_url': f"@{topics[0]}{index}" if rng.random() < 0.6 else '',
+            'description': (
+                f"Videos about {', '.join(topics)}."
+                + (" Business inquiries: contact@example.com" if business else "")
+            ),
+            'published_at': _iso(self.reference_date - timedelta(days=rng.randint(200, 4000)))
+        }
+        with self._lock:
+            self._channels[index] = channel
+        return channel
+
+    def search(self, query):
+        """Channel indices matching a query, best match first"""
+        words = [w for w in query.lower().split() if w in self._topic_index]
+        scores = Counter()
+        for word in words:
+            for index in self._topic_index[word]:
+                scores[index] += 1
+
+        def tiebreak(index):
+            return hashlib.sha1(f"{query}:{index}".encode()).digest()
+
+        ranked = sorted(scores, key=lambda i: (-scores[i], tiebreak(i)))
+        return ranked[:MAX_SEARCH_RESULTS]
+
+    def video_id(self, channel_index, video_index):
+        return f"V{channel_index:07d}x{video_index:02d}"
+
+    def video(self, video_id):
+        try:
+            channel_index, video_index = int(video_id[1:8]), int(video_id[9:])
+        except ValueError:
+            return None
+        if not (0 <= channel_index < self.size and 0 <= video_index < self.videos_per_channel):
+            return None
+
+        channel = self.channel(channel_index)
+        rng = random.Random(f"{self.seed}:video:{video_id}")
+        views = int(channel['avg_views'] * rng.lognormvariate(0, 0.8))
+        published = self.reference_date - timedelta(days=video_index * channel['upload_interval_days'] + rng.random())
+        return {
+            'id': video_id,
+            'channel_index': channel_index,
+            'title': f"{channel['topics'][video_index % 4].title()} video #{video_index}",
+            'published_at': _iso(published),
+            'views': views,
+            'likes': int(views * rng.uniform(0.01, 0.06)),
+            'comments': int(views * rng.uniform(0.001, 0.01)),
+            'duration': "PT45S" if rng.random() < 0.2 else f"PT{rng.randint(3, 25)}M{rng.randint(0, 59)}S"
+        }
+
+
+class MockYouTubeAPI:
+    """Threaded HTTP server answering the finder's four endpoints from a SyntheticCorpus.
+
+    latency: seconds added to every response (plus up to 50% jitter)
+    error_rate: fraction of requests failing with a retryable 403 rateLimitExceeded / 503
+    quota_limit: units each API key may spend before every call returns quotaExceeded
+    """
+
+    def __init__(self, channels=1000, videos_per_channel=30, latency=0.0, error_rate=0.0,
+                 quota_limit=None, seed=0, host="127.0.0.1", port=0, reference_date=None):
+        self.corpus = SyntheticCorpus(channels, videos_per_channel, seed, reference_date)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.quota_limit = quota_limit
+        self.requests = Counter()
+        self.errors = Counter()
+        self.units_by_key = Counter()
+        self.bytes_sent = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/youtube/v3"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'requests': dict(self.requests),
+                'total_requests': sum(self.requests.values()),
+                'errors': dict(self.errors),
+                'bytes_sent': self.bytes_sent
+            }
+
+    def _handler_class(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+            # Headers and body go out as separate small writes; with Nagle's algorithm the body
+            # waits for the client's delayed ACK, adding ~40 ms to every keep-alive request
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                endpoint = url.path.rstrip('/').rsplit('/', 1)[-1]
+                params = {k: v[0] for k, v in parse_qs(url.query).items()}
+                status, body = api.handle(endpoint, params, self.headers.get('If-None-Match'))
+                payload = json.dumps(body).encode('utf-8') if status != 304 else b''
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=UTF-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+                with api._lock:
+                    api.bytes_sent += len(payload)
+
+        return Handler
+
+    def _error(self, status, reason, message):
+        with self._lock:
+            self.errors[reason] += 1
+        return status, {'error': {'code': status, 'message': message,
+                                  'errors': [{'reason': reason, 'message': message}]}}
+
+    def handle(self, endpoint, params, if_none_match=None):
+        """Return (status, JSON body) for one request"""
+        if endpoint not in QUOTA_COSTS:
+            return self._error(404, 'notFound', f"Unknown endpoint {endpoint}")
+
+        if self.latency:
+            with self._lock:
+                jitter = self._rng.uniform(0, self.latency * 0.5)
+            time.sleep(self.latency + jitter)
+
+        key = params.get('key', '')
+        with self._lock:
+            self.requests[endpoint] += 1
+            over_quota = self.quota_limit is not None and self.units_by_key[key] >= self.quota_limit
+            if not over_quota:
+                self.units_by_key[key] += QUOTA_COSTS[endpoint]
+            roll = self._rng.random()
+
+        if over_quota:
+            return self._error(403, 'quotaExceeded', "The request cannot be completed because you have exceeded your quota.")
+        if roll < self.error_rate / 2:
+            return self._error(403, 'rateLimitExceeded', "Rate limit exceeded.")
+        if roll < self.error_rate:
+            return self._error(503, 'backendError', "Backend Error")
+
+        body = getattr(self, f"_{endpoint}")(params)
+        for item in body['items']:
+            item['etag'] = _etag(item)
+        body['etag'] = _etag(body)
+        if if_none_match == body['etag']:
+            return 304, None
+        return 200, body
+
+    def _search(self, params):
+        ranked = self.corpus.search(params.get('q', ''))
+        offset = int(params.get('pageToken') or 0)
+        max_results = min(50, int(params.get('maxResults', 5)))
+        page = ranked[offset:offset + max_results]
+
+        items = []
+        for index in page:
+            channel = self.corpus.channel(index)
+            items.append({
+                'id': {'kind': 'youtube#channel', 'channelId': channel['id']},
+                'snippet': {'channelId': channel['id'], 'title': channel['title'],
+                            'description': channel['description']}
+            })
+
+        body = {'items': items, 'pageInfo': {'totalResults': len(ranked), 'resultsPerPage': max_results}}
+        if offset + max_results < len(ranked):
+            body['nextPageToken'] = str(offset + max_results)
+        return body
+
+    def _channels(self, params):
+        items = []
+        for channel_id in params.get('id', '').split(','):
+            index = self.corpus.channel_index(channel_id)
+            if index is None:
+                continue
+            channel = self.corpus.channel(index)
+            items.append({
+                'id': channel['id'],
+                'statistics': {
+                    'subscriberCount': str(channel['subscribers']),
+                    'viewCount': str(channel['avg_views'] * self.corpus.videos_per_channel),
+                    'videoCount': str(self.corpus.videos_per_channel)
+                },
+                'snippet': {
+                    'title': channel['title'],
+                    'description': channel['description'],
+                    'customUrl': channel['custom_url'],
+                    'country': channel['country'],
+                    'publishedAt': channel['published_at']
+                },
+                'contentDetails': {'relatedPlaylists': {'uploads': 'UU' + channel['id'][2:]}},
+                'brandingSettings': {'channel': {'keywords': ' '.join(channel['topics'])}}
+            })
+        return {'items': items}
+
+    def _playlistItems(self, params):
+        playlist_id = params.get('playlistId', '')
+        index = self.corpus.channel_index('UC' + playlist_id[2:])
+        if index is None:
+            return {'items': []}
+
+        offset = int(params.get('pageToken') or 0)
+        max_results = min(50, int(params.get('maxResults', 5)))
+        end = min(self.corpus.videos_per_channel, offset + max_results)
+        items = []
+        for video_index in range(offset, end):
+            video = self.corpus.video(self.corpus.video_id(index, video_index))
+            items.append({
+                'snippet': {'publishedAt': video['published_at'], 'title': video['title']},
+                'contentDetails': {'videoId': video['id'], 'videoPublishedAt': video['published_at']}
+            })
+
+        body = {'items': items, 'pageInfo': {'totalResults': self.corpus.videos_per_channel}}
+        if end < self.corpus.videos_per_channel:
+            body['nextPageToken'] = str(end)
+        return body
+
+    def _videos(self, params):
+        items = []
+        for video_id in params.get('id', '').split(','):
+            video = self.corpus.video(video_id)
+            if video is None:
+                continue
+            items.append({
+                'id': video['id'],
+                'snippet': {'title': video['title'], 'publishedAt': video['published_at']},
+                'statistics': {
+                    'viewCount': str(video['views']),
+                    'likeCount': str(video['likes']),
+                    'commentCount': str(video['comments'])
+                },
+                'contentDetails': {'duration': video['duration']}
+            })
+        return {'items': items}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a synthetic YouTube Data API for offline runs")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--channels', type=int, default=5000, help="synthetic corpus size")
+    parser.add_argument('--videos-per-channel', type=int, default=30)
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="fraction of retryable errors")
+    parser.add_argument('--quota-limit', type=int, default=None, help="units per API key before quotaExceeded")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    api = MockYouTubeAPI(
+        channels=args.channels, videos_per_channel=args.videos_per_channel, latency=args.latency,
+        error_rate=args.error_rate, quota_limit=args.quota_limit, seed=args.seed,
+        host=args.host, port=args.port
+    )
+    print(f"🧪 Mock YouTube API serving {args.channels} channels at {api.base_url}")
+    print("   Press Ctrl-C to stop")
+    api.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        api.stop()
+        print(f"\n📊 {api.stats()}")
+
+
+if __name__ == "__main__":
+    main()
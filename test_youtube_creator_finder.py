@@ -0,0 +1,644 @@
+"""Tests for youtube_creator_finder.py, run against the offline mock API:
+
+    python -m pytest -q
+"""
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+import youtube_creator_finder as finder_module
+from mock_youtube_api import MockYouTubeAPI
+from youtube_creator_finder import (
+    CATEGORIES, CATEGORY_REASONS, TIER_CONFIG, TIER_NOTES, AnalyticsWindow, ApiCache, CandidatePool, Cassette,
+    CassetteMissError, ChannelIndex, ChannelRecord, KeywordTask, QuotaExhaustedError, RejectionIndex, SharedStore,
+    TokenBucket, VetBatch, VideoRecord, YouTubeCreatorFinder
+)
+
+
+CATEGORY = "VFX & Visual Effects Artists"
+OTHER_CATEGORY = "Animation & Motion Graphics Artists"
+NANO, MICRO = list(TIER_CONFIG.keys())[:2]
+
+
+@pytest.fixture(scope="module")
+def api():
+    api = MockYouTubeAPI(channels=300, seed=1)
+    api.start()
+    yield api
+    api.stop()
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(finder_module, 'RETRY_BASE_DELAY', 0.01)
+
+
+def make_finder(base_url, **kwargs):
+    return YouTubeCreatorFinder("test-key", api_base_url=base_url, rate_limiter=TokenBucket(1000, 1000), **kwargs)
+
+
+def make_row(channel_id, category_name, tier=NANO, avg_views=1000, **extra):
+    return dict({
+        'Channel ID': channel_id,
+        'Content Category': category_name,
+        'Subscriber Category': tier,
+        'Subscribers (Raw)': 5000,
+        'Avg Views (Raw)': avg_views
+    }, **extra)
+
+
+def drop(row, columns):
+    return {k: v for k, v in row.items() if k not in columns}
+
+
+def discover(finder, query="vfx nuke compositing", max_results=60):
+    """Creator rows for a query's channels that fall in a tier, as a discovery run records them"""
+    channels = finder.search_channels(query, max_results=max_results)
+    stats = finder.get_channel_stats([c.channel_id for c in channels])
+    videos = finder.get_recent_videos_stats_batch(stats)
+    return [
+        finder._creator_data(c, stats[c.channel_id], videos[c.channel_id], CATEGORY)
+        for c in channels
+        if c.channel_id in stats and finder.get_tier_for_subscribers(stats[c.channel_id].subscribers)
+    ]
+
+
+# ApiCache
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(finder_module.time, 'time', lambda: now[0])
+    return now
+
+
+def test_cache_entries_expire_after_their_kind_ttl(tmp_path, clock):
+    cache = ApiCache(str(tmp_path / "cache.sqlite"), ttls={'channel': 100, 'search': 1000})
+    cache.put('channel', 'UC1', {'subscribers': 5000})
+    cache.put('search', 'vfx', ['UC1'])
+
+    clock[0] += 99
+    assert cache.get('channel', 'UC1') == {'subscribers': 5000}
+    clock[0] += 2
+    assert cache.get('channel', 'UC1') is None
+    assert cache.get('search', 'vfx') == ['UC1']
+    # Stale entries stay readable for rebuilding the local index
+    assert dict(cache.items('channel')) == {'UC1': {'subscribers': 5000}}
+    assert (cache.hits, cache.misses) == (2, 1)
+    cache.close()
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path, clock):
+    path = str(tmp_path / "cache.sqlite")
+    cache = ApiCache(path, max_entries=2)
+    for key in ('a', 'b', 'c'):
+        clock[0] += 1
+        cache.put('channel', key, key)
+    clock[0] += 1
+    assert cache.get('channel', 'a') == 'a'
+    cache.close()
+
+    cache = ApiCache(path, max_entries=2)
+    assert cache.get_many('channel', ['a', 'b', 'c']) == {'a': 'a', 'c': 'c'}
+    cache.close()
+
+
+# CandidatePool
+
+def test_assign_fills_each_tier_best_score_first():
+    pool = CandidatePool(lambda rows: [row['Score'] for row in rows])
+    pool.add(make_row('low', CATEGORY, Score=10))
+    pool.add(make_row('high', CATEGORY, Score=90))
+    pool.add(make_row('mid', CATEGORY, Score=50))
+
+    assignment = pool.assign({CATEGORY: {NANO: 2}})
+
+    assert [row['Channel ID'] for row in assignment[CATEGORY]] == ['high', 'mid']
+
+
+def test_assign_places_each_channel_once():
+    pool = CandidatePool(lambda rows: [row['Score'] for row in rows])
+    # 'both' was found twice by CATEGORY's keywords, so ties go there
+    pool.add(make_row('both', CATEGORY, Score=90))
+    pool.add(make_row('both', CATEGORY, Score=90))
+    pool.add(make_row('both', OTHER_CATEGORY, Score=90))
+    pool.add(make_row('only', CATEGORY, Score=80))
+    pool.add(make_row('either', CATEGORY, Score=50))
+    pool.add(make_row('either', OTHER_CATEGORY, Score=50))
+
+    assignment = pool.assign({CATEGORY: {NANO: 1}, OTHER_CATEGORY: {NANO: 1}})
+
+    assert [row['Channel ID'] for row in assignment[CATEGORY]] == ['both']
+    assert [row['Channel ID'] for row in assignment[OTHER_CATEGORY]] == ['either']
+
+
+def test_assign_scores_only_new_channels():
+    scored = []
+
+    def scorer(rows):
+        scored.extend(row['Channel ID'] for row in rows)
+        return [0.0] * len(rows)
+
+    pool = CandidatePool(scorer)
+    pool.add(make_row('a', CATEGORY))
+    pool.assign({CATEGORY: {NANO: 5}})
+    pool.add(make_row('b', CATEGORY))
+    pool.add(make_row('a', OTHER_CATEGORY))
+    pool.assign({CATEGORY: {NANO: 5}})
+
+    assert scored == ['a', 'b']
+
+
+# SharedStore
+
+def test_store_hands_out_each_unit_once(tmp_path):
+    store = SharedStore(str(tmp_path / "store.sqlite"))
+    store.setup([(CATEGORY, "nuke"), (CATEGORY, "houdini")], {CATEGORY: {NANO: 1}})
+
+    assert store.next_unit("w1") == (CATEGORY, "nuke")
+    assert store.next_unit("w2") == (CATEGORY, "houdini")
+    assert store.next_unit("w3") is None
+    # An expired lease makes a claimed unit available again
+    assert store.next_unit("w3", lease=-1) == (CATEGORY, "nuke")
+    store.close()
+
+
+def test_store_claims_channels_for_one_worker(tmp_path):
+    store = SharedStore(str(tmp_path / "store.sqlite"))
+
+    assert store.claim(["c1", "c2"], "w1", CATEGORY) == {"c1", "c2"}
+    assert store.claim(["c2", "c3"], "w2", OTHER_CATEGORY) == {"c3"}
+    # The channel another worker claimed is still a hit for this worker's category
+    assert ("c2", OTHER_CATEGORY) in store.hits()
+
+    store.release(["c2"])
+    assert store.claim(["c2"], "w2", OTHER_CATEGORY) == {"c2"}
+    store.close()
+
+
+def test_store_reopen_requeues_skipped_and_limited_units(tmp_path):
+    store = SharedStore(str(tmp_path / "store.sqlite"))
+    store.setup([(CATEGORY, "a"), (CATEGORY, "b"), (CATEGORY, "c"), (OTHER_CATEGORY, "d")],
+                {CATEGORY: {NANO: 1}, OTHER_CATEGORY: {NANO: 1}})
+    store.finish_unit(CATEGORY, "a", 'skipped')
+    store.finish_unit(CATEGORY, "b", 'limited')
+    store.finish_unit(CATEGORY, "c", 'done')
+    store.finish_unit(OTHER_CATEGORY, "d", 'skipped')
+
+    assert store.reopen(CATEGORY) == 2
+    assert store.progress() == {'pending': 2, 'done': 1, 'skipped': 1}
+    store.close()
+
+
+def test_worker_counts_a_channel_toward_one_category(tmp_path):
+    store = SharedStore(str(tmp_path / "store.sqlite"))
+    finder = YouTubeCreatorFinder("test-key")
+    store.setup([], finder.targets)
+    # One channel surfaced by two categories is one candidate row per category
+    store.write(make_row("shared", CATEGORY))
+    store.write(make_row("shared", OTHER_CATEGORY))
+    store.write(make_row("micro", OTHER_CATEGORY, tier=MICRO))
+    finder.store = store
+    finder.shared_pool = CandidatePool(finder.partnership_scores)
+
+    finder._sync_tier_counts()
+
+    assert sum(counts[NANO] for counts in finder.category_tier_counts.values()) == 1
+    assert finder.category_tier_counts[OTHER_CATEGORY][MICRO] == 1
+    assert finder.tier_counts[NANO] == 1
+    finder.close()
+    store.close()
+
+
+# Refresh
+
+def test_refresh_conditional_requests(api, tmp_path):
+    cache = ApiCache(str(tmp_path / "cache.sqlite"))
+    finder = make_finder(api.base_url, cache=cache)
+    creators = discover(finder)
+    finder.close()
+    assert creators
+    channel_ids = [c['Channel ID'] for c in creators]
+
+    finder = make_finder(api.base_url, cache=cache)
+    records, gone, unchanged = finder.refresh_channel_stats(channel_ids)
+    assert (len(records), gone, unchanged) == (len(creators), set(), 0)
+
+    # Nothing changed since the stored ETags: every batch is a 304
+    records, gone, unchanged = finder.refresh_channel_stats(channel_ids)
+    assert unchanged == -(-len(channel_ids) // 50)
+    assert len(records) == len(creators)
+
+    # A 304 applies the cached numbers, not the (older) ones in the file
+    stale = [dict(c, **{'Subscribers (Raw)': 1234}) for c in creators]
+    stale_path = tmp_path / "stale.jsonl"
+    stale_path.write_text("".join(json.dumps(c) + "\n" for c in stale), encoding='utf-8')
+    finder.export_formats = ['csv']
+    df = finder.refresh(str(stale_path), str(tmp_path / "refreshed.csv"))
+    assert not (df['Subscribers (Raw)'] == 1234).any()
+    assert sorted(df['Subscribers (Raw)']) == sorted(c['Subscribers (Raw)'] for c in creators)
+    finder.close()
+
+    # A changed channel makes its batch a full response with the new numbers
+    channel = api.corpus.channel(api.corpus.channel_index(channel_ids[0]))
+    channel['subscribers'] += 1
+    finder = make_finder(api.base_url, cache=cache)
+    records, gone, unchanged = finder.refresh_channel_stats(channel_ids)
+    assert records[channel_ids[0]].subscribers == channel['subscribers']
+    assert unchanged == -(-len(channel_ids) // 50) - 1
+    finder.close()
+    cache.close()
+
+
+# Cassette
+
+def test_cassette_round_trip(api, tmp_path):
+    path = str(tmp_path / "session.cassette")
+    cassette = Cassette(path, mode="record")
+    finder = make_finder(api.base_url, cassette=cassette)
+    recorded = discover(finder)
+    finder.close()
+    cassette.close()
+
+    # Replay never reaches the network: the base URL points nowhere
+    cassette = Cassette(path, mode="replay")
+    finder = make_finder("http://127.0.0.1:9/youtube/v3", cassette=cassette)
+    replayed = discover(finder)
+    # Per-day figures move with the clock between the two sessions
+    clock = ['Views per Day', 'Last Upload (Days)']
+    assert [drop(row, clock) for row in replayed] == [drop(row, clock) for row in recorded]
+    assert cassette.misses == 0
+
+    with pytest.raises(CassetteMissError):
+        finder.search_channels("a query nobody recorded")
+    finder.close()
+    cassette.close()
+
+
+def test_cassette_sessions_run_serially(tmp_path):
+    cassette = Cassette(str(tmp_path / "session.cassette"), mode="record")
+    finder = YouTubeCreatorFinder("test-key", max_workers=8, category_workers=2, cassette=cassette)
+    assert (finder.max_workers, finder.category_workers) == (1, 1)
+    finder.close()
+    cassette.close()
+
+
+# AnalyticsWindow
+
+NOW = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def published(days_ago):
+    return (NOW - timedelta(days=days_ago)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+UPLOADS = [["v1", published(2)], ["v2", published(10)], ["v3", published(20)], ["v4", published(40)]]
+
+
+@pytest.mark.parametrize("window, expected", [
+    (AnalyticsWindow(max_videos=2, max_age_days=30), ["v1", "v2"]),
+    (AnalyticsWindow(max_videos=None, max_age_days=30), ["v1", "v2", "v3"]),
+    (AnalyticsWindow(max_videos=None, max_age_days=30, min_age_days=5), ["v2", "v3"]),
+    (AnalyticsWindow(max_videos=None, max_age_days=None), ["v1", "v2", "v3", "v4"]),
+    (AnalyticsWindow(max_videos=10, max_age_days=1), []),
+])
+def test_window_select(window, expected):
+    assert window.select(UPLOADS, NOW) == expected
+
+
+def test_window_summarize():
+    window = AnalyticsWindow(max_videos=10, max_age_days=30)
+    videos = [
+        VideoRecord("v1", views=200, likes=20, comments=2, published_at=published(2)),
+        VideoRecord("v2", views=1000, likes=50, comments=5, published_at=published(10)),
+        VideoRecord("v3", views=400, likes=10, comments=1, published_at=published(20)),
+    ]
+
+    summary = window.summarize(UPLOADS, videos, NOW)
+
+    assert summary == {
+        'Median Views (Raw)': 400,
+        'Views per Day': 100.0,
+        'Uploads per Week': 1.05,
+        'Last Upload (Days)': 2.0,
+        'Recent Videos': 3,
+        'Recent Views': 1600,
+        'Recent Likes': 80,
+        'Recent Comments': 8
+    }
+
+
+def test_window_summarize_without_uploads():
+    summary = AnalyticsWindow(max_age_days=30).summarize([], [], NOW)
+    assert summary['Recent Videos'] == 0
+    assert summary['Last Upload (Days)'] is None
+
+
+
+# Retries and quota errors
+
+def test_run_stops_cleanly_when_quota_runs_out(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    api = MockYouTubeAPI(channels=100, quota_limit=0)
+    api.start()
+    finder = make_finder(api.base_url)
+    try:
+        df = finder.run(str(tmp_path / "creators.csv"))
+    finally:
+        finder.close()
+        api.stop()
+
+    assert len(df) == 0
+    assert finder.quota_exhausted
+    assert "Run again with --resume" in capsys.readouterr().out
+
+
+def test_retryable_errors_are_retried_then_leave_the_keyword_incomplete(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    api = MockYouTubeAPI(channels=100, error_rate=1.0)
+    api.start()
+    finder = make_finder(api.base_url, max_retries=2, max_workers=1)
+    config = dict(CATEGORIES[CATEGORY], keywords=CATEGORIES[CATEGORY]['keywords'][:1])
+    try:
+        finder.find_creators_for_category(CATEGORY, config)
+    finally:
+        finder.close()
+        api.stop()
+
+    # One try plus max_retries retries, then the keyword is left for --resume
+    assert api.stats()['requests'] == {'search': 3}
+    assert finder.failed_keywords[CATEGORY] == config['keywords']
+    assert not finder.completed_keywords[CATEGORY]
+    assert CATEGORY not in finder.completed_categories
+
+
+def test_quota_errors_rotate_keys_without_retrying():
+    api = MockYouTubeAPI(channels=100, quota_limit=100)
+    api.start()
+    finder = YouTubeCreatorFinder(["key-1", "key-2"], api_base_url=api.base_url,
+                                  rate_limiter=TokenBucket(1000, 1000))
+    try:
+        assert finder.search_channels("vfx")
+        assert finder.search_channels("nuke")
+        # Each key has spent its 100 units: both are rotated out and the call gives up
+        with pytest.raises(QuotaExhaustedError):
+            finder.search_channels("blender")
+    finally:
+        finder.close()
+        api.stop()
+
+    assert api.stats()['errors'] == {'quotaExceeded': 2}
+    assert finder.keys.available == 0
+
+
+# Skip rules
+
+def test_rejection_skip_rules():
+    rejections = RejectionIndex(window="window-a")
+    rejections.record("small", 'out_of_tier', subscribers=50)
+    rejections.record("full", 'tier_full', subscribers=5000, tier=NANO)
+    rejections.record("quiet", 'no_recent_uploads', subscribers=5000, tier=NANO)
+    rejections.record("unwatched", 'low_views', subscribers=5000, avg_views=40, tier=NANO)
+    targets = {NANO: 2}
+
+    assert rejections.skip_reason("small", {NANO: 0}, targets) == 'out_of_tier'
+    # A tier-full channel is worth another look once its tier has room again
+    assert rejections.skip_reason("full", {NANO: 2}, targets) == 'tier_full'
+    assert rejections.skip_reason("full", {NANO: 1}, targets) is None
+    assert rejections.skip_reason("quiet", {NANO: 0}, targets) == 'no_recent_uploads'
+    assert rejections.skip_reason("unwatched", {NANO: 0}, targets) == 'low_views'
+    assert rejections.skip_reason("unknown", {NANO: 0}, targets) is None
+
+    # Analytics-based rejections are re-evaluated under a different window
+    rejections.window = "window-b"
+    assert rejections.skip_reason("quiet", {NANO: 0}, targets) is None
+    assert rejections.skip_reason("unwatched", {NANO: 0}, targets) is None
+
+
+def test_failed_video_fetch_is_not_a_rejection(api, monkeypatch):
+    finder = make_finder(api.base_url)
+    channels = finder.search_channels("vfx nuke", max_results=10)
+    stats = finder.get_channel_stats([c.channel_id for c in channels])
+
+    def unavailable(*args, **kwargs):
+        raise HttpError(httplib2.Response({'status': 503}), b'{}')
+
+    monkeypatch.setattr(finder, 'get_uploads', unavailable)
+    batch = VetBatch([c for c in channels if c.channel_id in stats])
+    batch.stats = stats
+    batch.videos = finder.get_recent_videos_stats_batch(stats)
+    task = KeywordTask("vfx nuke", CATEGORY, finder.targets[CATEGORY], {tier: 0 for tier in TIER_CONFIG}, None)
+    list(finder._offer_stage(task, iter([batch])))
+    finder.close()
+
+    assert all(video_data['error'] for video_data in batch.videos.values())
+    assert finder.rejections.entries == {}
+    assert len(finder.pool) == 0
+
+
+# Local channel index
+
+@pytest.fixture
+def index(tmp_path):
+    index = ChannelIndex(str(tmp_path / "index.sqlite"))
+    fillers = [f"filler{i}" for i in range(20)]
+    index.add_names(dict({
+        "full_name": "Nuke Compositing Tutorials",
+        "full_description": "Studio Lumen",
+        "rare": "Nuke",
+        "common": "Daily Tutorials"
+    }, **{cid: f"Channel {cid}" for cid in fillers}))
+    index.add_channels(dict({
+        "full_description": ChannelRecord("full_description", description="nuke compositing tutorial breakdowns"),
+        "rare": ChannelRecord("rare", keywords="nuke compositing")
+    }, **{cid: ChannelRecord(cid, description="weekly tutorial uploads") for cid in fillers}))
+    yield index
+    index.close()
+
+
+def test_index_ranks_full_matches_before_strong_partial_ones(index):
+    results = [channel_id for channel_id, _ in index.search("Nuke compositing tutorial")]
+
+    # Names weigh more than descriptions; "rare" outscores "full_description" on its rare words
+    # but misses "tutorial", so it follows every full match. "tutorial" alone is too common to match.
+    assert results == ["full_name", "full_description", "rare"]
+    assert index.search("nuke compositing tutorial", limit=1) == [("full_name", "Nuke Compositing Tutorials")]
+
+
+def test_index_search_edge_cases(index):
+    assert index.search("  -- ") == []
+    assert index.search("houdini") == []
+    # Porter stemming matches other forms of a word
+    assert {channel_id for channel_id, _ in index.search("composite")} == {"full_name", "full_description", "rare"}
+    assert len(index) == 24
+
+
+# Keyword scheduling
+
+def test_scheduler_ranks_keywords_by_yield_for_short_tiers(tmp_path):
+    cache = ApiCache(str(tmp_path / "cache.sqlite"))
+    scheduler = finder_module.KeywordScheduler(cache)
+    keywords = ["dry", "untried", "nano", "micro"]
+    scheduler.record_page(CATEGORY, "dry", 100, {})
+    scheduler.record_page(CATEGORY, "nano", 100, {NANO: 20})
+    scheduler.record_page(CATEGORY, "micro", 100, {MICRO: 30})
+    targets = {NANO: 10, MICRO: 10}
+    empty = {tier: 0 for tier in TIER_CONFIG}
+    micro_full = dict(empty, **{MICRO: 10})
+
+    assert scheduler.next_keyword(CATEGORY, keywords, empty, targets) == "micro"
+    # Once a tier is full, keywords are ranked on the tiers still short only
+    assert scheduler.next_keyword(CATEGORY, keywords, micro_full, targets) == "nano"
+    assert scheduler.next_keyword(CATEGORY, ["dry", "untried"], empty, targets) == "untried"
+    # Ties keep list order
+    assert scheduler.next_keyword(CATEGORY, ["untried", "new"], empty, targets) == "untried"
+
+    # History carries over to later runs through the cache
+    later = finder_module.KeywordScheduler(cache)
+    later.load(CATEGORY, keywords)
+    assert later.next_keyword(CATEGORY, keywords, micro_full, targets) == "nano"
+    cache.close()
+
+
+@pytest.mark.parametrize("known,pages", [(False, 1), (True, finder_module.KEYWORD_MAX_PAGES)])
+def test_paging_stops_when_a_page_yields_too_little(api, known, pages):
+    finder = make_finder(api.base_url)
+
+    def mark_known(task, batches):
+        for batch in batches:
+            batch.known = batch.found if known else 0
+            yield batch
+
+    finder.vet_stages = [mark_known]
+    before = api.stats()['requests'].get('search', 0)
+    tier_counts = {tier: 0 for tier in TIER_CONFIG}
+    assert finder._process_keyword("vfx nuke compositing", CATEGORY, finder.targets[CATEGORY], tier_counts,
+                                   threading.Event())
+    finder.close()
+
+    assert api.stats()['requests']['search'] - before == pages
+    assert finder.scheduler.stats[f"{CATEGORY}|vfx nuke compositing"]['pages'] == pages
+
+
+def test_paging_stops_once_every_target_is_met(api):
+    finder = make_finder(api.base_url)
+    targets = finder.targets[CATEGORY] = dict({tier: 0 for tier in TIER_CONFIG}, **{NANO: 1})
+    tier_counts = finder.category_tier_counts[CATEGORY] = {tier: 0 for tier in TIER_CONFIG}
+    stop_event = threading.Event()
+    before = api.stats()['requests'].get('search', 0)
+    assert finder._process_keyword("vfx nuke compositing", CATEGORY, targets, tier_counts, stop_event)
+    finder.close()
+
+    assert stop_event.is_set()
+    assert tier_counts[NANO] == 1
+    assert api.stats()['requests']['search'] - before == 1
+
+
+# Vetting stages
+
+def make_task(finder, keyword, category_name):
+    return KeywordTask(keyword, category_name, finder.targets[category_name], {tier: 0 for tier in TIER_CONFIG},
+                       threading.Event())
+
+
+def test_pipeline_yields_one_batch_per_page(api):
+    finder = make_finder(api.base_url)
+    before = api.stats()['requests'].get('search', 0)
+    pipeline = finder.vetting_pipeline(make_task(finder, "vfx nuke compositing", CATEGORY))
+    first = next(pipeline)
+    # Pulling one batch through every stage fetches only the first page of results
+    assert api.stats()['requests']['search'] - before == 1
+    assert set(first.videos) == {c.channel_id for c in first.channels}
+    pipeline.close()
+    finder.close()
+
+
+def test_known_channels_are_offered_to_other_categories_without_refetching(api):
+    finder = make_finder(api.base_url)
+    list(finder.vetting_pipeline(make_task(finder, "vfx nuke compositing", CATEGORY)))
+    qualified = dict(finder.pool.entries)
+    assert qualified
+    before = api.stats()['requests']
+
+    batches = list(finder.vetting_pipeline(make_task(finder, "vfx nuke compositing", OTHER_CATEGORY)))
+    after = api.stats()['requests']
+    finder.close()
+
+    for endpoint in ('channels', 'playlistItems', 'videos'):
+        assert after.get(endpoint, 0) == before.get(endpoint, 0)
+    assert sum(batch.known for batch in batches) >= len(qualified)
+    for channel_id, entry in qualified.items():
+        rows = entry['rows']
+        assert set(rows) == {CATEGORY, OTHER_CATEGORY}
+        assert drop(rows[OTHER_CATEGORY], ['Content Category']) == drop(rows[CATEGORY], ['Content Category'])
+    assert finder.pool.stats.keys().isdisjoint(finder.pool.entries)
+
+
+# Scoring
+
+MID_TIER, MACRO = list(TIER_CONFIG.keys())[2:4]
+
+
+@pytest.mark.parametrize("subs,tier,label", [
+    (999, None, "999"),
+    (1000, NANO, "1.0K"),
+    (9999, NANO, "10.0K"),
+    (10000, MICRO, "10.0K"),
+    (500000, MACRO, "500.0K"),
+    (2240000, MACRO, "2.24M"),
+])
+def test_score_creators_bins_tiers(api, subs, tier, label):
+    finder = make_finder(api.base_url)
+    df = finder.score_creators([make_row("c", CATEGORY, tier="previous", **{'Subscribers (Raw)': subs})])
+    finder.close()
+
+    # A channel below every tier keeps the tier it was recorded under
+    assert df['Subscriber Category'][0] == (tier or "previous")
+    assert df['Subscribers'][0] == label
+
+
+@pytest.mark.parametrize("avg_views,label", [
+    (999, "0-1K"), (1000, "1K-5K"), (9999, "5K-10K"), (10000, "10K-20K"),
+    (499999, "300K-500K"), (500000, "500K-1M"), (1000000, "1M+"),
+])
+def test_score_creators_bins_view_ranges(api, avg_views, label):
+    finder = make_finder(api.base_url)
+    df = finder.score_creators([make_row("c", CATEGORY, avg_views=avg_views)])
+    finder.close()
+
+    assert df['Avg Views'][0] == label
+
+
+@pytest.mark.parametrize("avg_views,engagement", [
+    (50, "Growing channel"), (101, "Good engagement rate"),
+    (251, "Strong engagement rate"), (501, "Very high engagement rate"),
+])
+@pytest.mark.parametrize("category_name", [CATEGORY, "Unlisted category"])
+def test_score_creators_why_text(api, avg_views, engagement, category_name):
+    finder = make_finder(api.base_url)
+    df = finder.score_creators([make_row("c", category_name, avg_views=avg_views)])
+    finder.close()
+
+    prefix, suffix = CATEGORY_REASONS.get(category_name, ("Active creator.", ""))
+    reason = f"{prefix} {engagement}." + (f" {suffix}" if suffix else "")
+    assert df['Why this Creator'][0] == f"{reason} {TIER_NOTES[NANO]}"
+
+
+def test_partnership_score_rewards_engagement_and_contact(api):
+    finder = make_finder(api.base_url)
+    scores = finder.partnership_scores([
+        make_row("quiet", CATEGORY, avg_views=50),
+        make_row("engaged", CATEGORY, avg_views=2500),
+        make_row("contact", CATEGORY, avg_views=2500, Description="Business email in the about tab"),
+        make_row("viral", CATEGORY, avg_views=5000000, Description="contact me"),
+    ])
+    finder.close()
+
+    assert list(scores) == sorted(scores)
+    assert 0 <= scores.min() and scores.max() <= 100
+    # Engagement saturates, so a viral channel scores no higher than an engaged one
+    assert scores[3] == scores[2]
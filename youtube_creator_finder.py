@@ -1,13 +1,181 @@
-import os
 import time
-import pandas as pd
-from googleapiclient.discovery import build
+
+STARTUP = time.perf_counter()
+
+import argparse
+import bisect
+import contextlib
+import cProfile
+import hashlib
+import importlib
+import json
+import os
+import pstats
+import random
+import re
+import socket
+import sqlite3
+import subprocess
+import sys
+import threading
+import zlib
 from googleapiclient.errors import HttpError
-from tqdm import tqdm
-from datetime import datetime
+from collections import defaultdict
+from itertools import zip_longest
+from statistics import median
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+
+# Startup phases for --timing: {phase: seconds}
+TIMINGS = {}
+
+
+@contextlib.contextmanager
+def timing(phase):
+    """Add the time spent in the block to TIMINGS[phase]"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        TIMINGS[phase] = TIMINGS.get(phase, 0.0) + time.perf_counter() - start
+
+
+class LazyModule:
+    """A module imported on first attribute access, timed under TIMINGS['import <name>'].
+    
+    pandas, numpy and aiohttp take most of the script's startup time; commands
+    that never build a DataFrame or use the async backend never import them.
+    """
+    
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+    
+    def load(self):
+        """Import the module now (raises ImportError if it is not installed)"""
+        if self._module is None:
+            with timing(f"import {self._name}"):
+                self._module = importlib.import_module(self._name)
+        return self._module
+    
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+aiohttp = LazyModule("aiohttp")  # Only needed for the async backend
 
 
 YOUTUBE_API_KEY = ""  # <-- PASTE YOUR API KEY HERE
+YOUTUBE_API_KEYS = []  # Optional extra keys (one per project); requests rotate across all keys
+
+# Concurrency: keywords searched in parallel per category, and categories in parallel
+MAX_WORKERS = 8
+CATEGORY_WORKERS = 2
+
+# Local API cache: reruns only hit the API for stale or missing entries
+CACHE_PATH = "youtube_cache.sqlite"
+CACHE_TTLS = {  # seconds
+    "search": 7 * 24 * 3600,
+    "channel": 24 * 3600,
+    "playlist": 24 * 3600,
+    "video": 24 * 3600,
+    "rejection": 30 * 24 * 3600,
+    "keyword": 90 * 24 * 3600,
+    "etag": 90 * 24 * 3600
+}
+CACHE_MAX_ENTRIES = 200000
+
+# Quota units per call (https://developers.google.com/youtube/v3/determine_quota_cost)
+QUOTA_COSTS = {
+    "search.list": 100,
+    "channels.list": 1,
+    "playlistItems.list": 1,
+    "videos.list": 1
+}
+QUOTA_BUDGET = None  # e.g. 10000 to plan the run around one project's daily quota
+
+# Keywords are searched a page at a time, best expected yield first. Paging stops once
+# a page accepts fewer than KEYWORD_MIN_YIELD creators per quota unit spent on it
+KEYWORD_PAGE_SIZE = 30
+KEYWORD_MAX_PAGES = 3
+KEYWORD_MIN_YIELD = 0.01
+# Yield assumed for keywords with no history, weighted as this many units of evidence
+KEYWORD_PRIOR_YIELD = 0.05
+KEYWORD_PRIOR_UNITS = 100
+
+# Recent-video analytics window: a channel's newest RECENT_VIDEOS_PER_CHANNEL uploads
+# published at most RECENT_VIDEOS_MAX_AGE_DAYS and at least RECENT_VIDEOS_MIN_AGE_DAYS
+# ago (None for no limit), picked from the newest UPLOADS_SAMPLED playlist items by
+# publish date so out-of-window videos are never fetched
+RECENT_VIDEOS_PER_CHANNEL = 10
+RECENT_VIDEOS_MAX_AGE_DAYS = 365
+RECENT_VIDEOS_MIN_AGE_DAYS = None
+UPLOADS_SAMPLED = 50  # The playlistItems maximum; one call costs the same for any page size
+
+# Local channel index: names, descriptions, keywords and video titles of every channel
+# ever fetched. Each category's keywords are matched against it (up to LOCAL_SEARCH_LIMIT
+# channels per keyword) before any search().list call, which is kept for the remainder
+INDEX_PATH = "channel_index.sqlite"
+LOCAL_SEARCH_LIMIT = 90
+# Channels matching only some of a keyword's words are kept if their BM25 score is at
+# least this fraction of the best all-words match, so one generic word isn't enough
+LOCAL_PARTIAL_MATCH_SCORE = 0.6
+
+# Rate limiting and retries shared by every API call
+RATE_LIMIT_QPS = 10
+RATE_LIMIT_BURST = 20
+MAX_RETRIES = 5
+RETRY_BASE_DELAY = 1.0  # seconds, doubled on every retry
+RETRY_MAX_DELAY = 60.0
+QUOTA_ERROR_REASONS = {"quotaExceeded", "dailyLimitExceeded"}
+RETRYABLE_ERROR_REASONS = {"rateLimitExceeded", "userRateLimitExceeded", "backendError", "internalError"}
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# HTTP backend: "sync" (googleapiclient, one client per thread) or "async" (aiohttp,
+# one pooled keep-alive session with up to ASYNC_CONCURRENCY requests in flight)
+API_BACKEND = "sync"
+API_BASE_URL = "https://www.googleapis.com/youtube/v3"  # Point at mock_youtube_api.py for offline runs
+ASYNC_CONCURRENCY = 64
+# Sync clients are built from a static discovery document instead of fetching one per client
+DISCOVERY_URL = "https://www.googleapis.com/discovery/v1/apis/youtube/v3/rest"
+DISCOVERY_CACHE_PATH = "youtube_v3_discovery.json"
+IO_WORKERS = 16  # Threads issuing per-channel calls (e.g. playlistItems) in parallel
+
+# Categories the final assignment leaves short search their remaining keywords again,
+# for at most this many rounds in total
+ASSIGNMENT_ROUNDS = 3
+
+# Distributed runs: a worker whose unit is unfinished after WORK_LEASE seconds is
+# presumed dead and its unit handed to another worker
+WORK_LEASE = 30 * 60
+WORKER_POLL_INTERVAL = 2.0
+COORDINATOR_POLL_INTERVAL = 5.0
+
+# Partial-response masks: only the attributes the finder reads come over the wire
+SEARCH_FIELDS = "nextPageToken,items/snippet(channelId,title)"
+CHANNEL_FIELDS = (
+    "items(id,statistics(subscriberCount,viewCount,videoCount),"
+    "snippet(customUrl,country,description,publishedAt),"
+    "contentDetails/relatedPlaylists/uploads,brandingSettings/channel/keywords)"
+)
+UPLOADS_PLAYLIST_FIELDS = "items/contentDetails/relatedPlaylists/uploads"
+PLAYLIST_ITEM_FIELDS = "items/contentDetails(videoId,videoPublishedAt)"
+VIDEO_FIELDS = "items(id,snippet(title,publishedAt),statistics(viewCount,likeCount,commentCount))"
+# Refresh mode: ETags plus just what a previously found creator's numbers need
+REFRESH_FIELDS = "etag,items(id,etag,statistics(subscriberCount,viewCount,videoCount),contentDetails/relatedPlaylists/uploads)"
+
+# Upper bounds of the latency histogram buckets (ms)
+LATENCY_BUCKETS_MS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float('inf')]
+
+# Output formats written by every run; add "parquet" (requires pyarrow) for columnar output
+EXPORT_FORMATS = ["csv", "xlsx"]
+
+# Progress of the current run, for run --resume after a crash, Ctrl-C or quota exhaustion
+CHECKPOINT_PATH = "finder_checkpoint.json"
 
 TIER_CONFIG = {
     "Nano (1K-10K subs)": {
@@ -37,6 +205,39 @@ TIER_CONFIG = {
 }
 
 
+# 'Why this Creator' text: (what the creator does, why their audience fits) per category
+CATEGORY_REASONS = {
+    "Tech & AI Content Creators": ("Reviews AI tools and technology.", "Audience actively seeks AI video tools."),
+    "Filmmakers & Cinematographers": ("Creates filmmaking content.", "Audience would benefit from AI video generation for production."),
+    "VFX & Visual Effects Artists": ("Specializes in visual effects.", "AI can accelerate complex effects and replace expensive stock footage."),
+    "Video Editors & Post-Production Specialists": ("Professional editing tutorials.", "Can demonstrate AI tools to professional audience."),
+    "Music Video Producers & Digital Artists": ("Creates music/visual content.", "AI video tools can help produce music videos efficiently."),
+    "Animation & Motion Graphics Artists": ("Motion graphics/animation creator.", "AI can significantly speed up animation workflow.")
+}
+TIER_NOTES = {
+    "Nano (1K-10K subs)": "Highly responsive to partnerships, affordable for scale.",
+    "Micro (10K-100K subs)": "Sweet spot for authentic partnerships with good reach.",
+    "Mid-Tier (100K-500K subs)": "Credibility builder, validates product for larger audiences.",
+    "Macro (500K-1M+ subs)": "Brand amplification and market-wide visibility."
+}
+
+# Average-view ranges for the 'Avg Views' column: lower bounds and labels
+VIEW_RANGE_EDGES = [1000, 5000, 10000, 20000, 50000, 100000, 300000, 500000, 1000000]
+VIEW_RANGE_LABELS = ["0-1K", "1K-5K", "5K-10K", "10K-20K", "20K-50K", "50K-100K",
+                     "100K-300K", "300K-500K", "500K-1M", "1M+"]
+
+# Composite partnership score: each signal is scaled to 0-1, saturating at the given
+# value, then weighted; the weights sum to 1
+PARTNERSHIP_SCORE = {
+    "engagement": (0.35, 0.10),  # avg views / subscribers
+    "like_rate": (0.20, 0.05),  # likes / views on recent videos
+    "comment_rate": (0.10, 0.005),  # comments / views on recent videos
+    "upload_cadence": (0.15, 2.0),  # recent uploads per week
+    "consistency": (0.10, 1.0),  # median / mean recent views; low for one-hit channels
+    "business_contact": (0.10, 1.0)  # description mentions a business contact
+}
+BUSINESS_CONTACT_WORDS = ['business', 'contact', 'email', 'collaboration', 'sponsor', 'partnership']
+
 CATEGORIES = {
     "Tech & AI Content Creators": {
         "description": "They already review AI tools for millions of tech-savvy subscribers. Their content ranks in Google for 'AI video tools' searches.",
@@ -148,353 +349,2639 @@ CATEGORIES = {
 }
 
 
-class YouTubeCreatorFinder:
-    def __init__(self, api_key):
-        self.youtube = build('youtube', 'v3', developerKey=api_key)
-        self.all_creators = []
-        self.seen_channel_ids = set()
-        self.tier_counts = {tier: 0 for tier in TIER_CONFIG.keys()}
+class SearchResult:
+    """Channel hit from search().list"""
     
-    def get_tier_for_subscribers(self, subscriber_count):
-        """Determine which tier a channel belongs to based on subscriber count"""
-        for tier_name, config in TIER_CONFIG.items():
-            if config["min_subs"] <= subscriber_count < config["max_subs"]:
-                return tier_name
-        if subscriber_count >= 500000:
-            return "Macro (500K-1M+ subs)"
+    __slots__ = ('channel_id', 'channel_name')
+    
+    def __init__(self, channel_id, channel_name):
+        self.channel_id = channel_id
+        self.channel_name = channel_name
+    
+    def to_row(self):
+        return [self.channel_id, self.channel_name]
+    
+    @classmethod
+    def from_row(cls, row):
+        return cls(*row)
+
+
+class ChannelRecord:
+    """Channel statistics, holding only the fields the finder reads"""
+    
+    __slots__ = ('channel_id', 'subscribers', 'total_views', 'video_count', 'custom_url',
+                 'country', 'description', 'keywords', 'published_at', 'uploads_playlist')
+    
+    def __init__(self, channel_id, subscribers=0, total_views=0, video_count=0, custom_url='',
+                 country='Unknown', description='', keywords='', published_at='', uploads_playlist=''):
+        self.channel_id = channel_id
+        self.subscribers = subscribers
+        self.total_views = total_views
+        self.video_count = video_count
+        self.custom_url = custom_url
+        self.country = country
+        self.description = description
+        self.keywords = keywords
+        self.published_at = published_at
+        self.uploads_playlist = uploads_playlist
+    
+    @classmethod
+    def from_api(cls, item):
+        """Build a record from a channels().list item"""
+        statistics = item.get('statistics', {})
+        snippet = item.get('snippet', {})
+        return cls(
+            item['id'],
+            subscribers=int(statistics.get('subscriberCount', 0)),
+            total_views=int(statistics.get('viewCount', 0)),
+            video_count=int(statistics.get('videoCount', 0)),
+            custom_url=snippet.get('customUrl', ''),
+            country=snippet.get('country', 'Unknown'),
+            description=snippet.get('description', '')[:500],
+            keywords=item.get('brandingSettings', {}).get('channel', {}).get('keywords', ''),
+            published_at=snippet.get('publishedAt', ''),
+            uploads_playlist=item.get('contentDetails', {}).get('relatedPlaylists', {}).get('uploads', '')
+        )
+    
+    @property
+    def channel_url(self):
+        if self.custom_url:
+            return f"https://www.youtube.com/{self.custom_url}"
+        return f"https://www.youtube.com/channel/{self.channel_id}"
+    
+    def to_row(self):
+        return [getattr(self, field) for field in self.__slots__]
+    
+    @classmethod
+    def from_row(cls, row):
+        return cls(*row)
+
+
+def age_days(published_at, now):
+    """Days between an ISO 8601 publish time and now, or None if unknown"""
+    if not published_at:
         return None
+    return (now - datetime.fromisoformat(published_at.replace('Z', '+00:00'))).total_seconds() / 86400
+
+
+class AnalyticsWindow:
+    """Which of a channel's uploads its recent-video analytics cover.
     
-    def format_subscriber_count(self, count):
-        """Format subscriber count for display (e.g., 2.24M, 184K)"""
-        if count >= 1000000:
-            return f"{count/1000000:.2f}M"
-        elif count >= 1000:
-            return f"{count/1000:.1f}K"
-        return str(count)
-    
-    def format_view_range(self, avg_views):
-        """Format average views as a range"""
-        if avg_views < 1000:
-            return f"0-1K"
-        elif avg_views < 5000:
-            return f"1K-5K"
-        elif avg_views < 10000:
-            return f"5K-10K"
-        elif avg_views < 20000:
-            return f"10K-20K"
-        elif avg_views < 50000:
-            return f"20K-50K"
-        elif avg_views < 100000:
-            return f"50K-100K"
-        elif avg_views < 300000:
-            return f"100K-300K"
-        elif avg_views < 500000:
-            return f"300K-500K"
-        elif avg_views < 1000000:
-            return f"500K-1M"
-        else:
-            return f"1M+"
+    The newest max_videos uploads published between max_age_days and min_age_days
+    ago; any limit may be None. Uploads are chosen from playlist items by publish
+    date, so only in-window videos need stats, and a different window over the
+    same cached playlist items and video stats needs no API calls.
+    """
     
-    def search_channels(self, query, max_results=50):
-        """Search for channels based on a query"""
-        channels = []
-        next_page_token = None
-        
-        while len(channels) < max_results:
-            try:
-                request = self.youtube.search().list(
-                    part="snippet",
-                    q=query,
-                    type="channel",
-                    maxResults=min(50, max_results - len(channels)),
-                    pageToken=next_page_token,
-                    relevanceLanguage="en"  # Focus on English content
-                )
-                response = request.execute()
-                
-                for item in response.get('items', []):
-                    channel_id = item['snippet']['channelId']
-                    if channel_id not in self.seen_channel_ids:
-                        channels.append({
-                            'channel_id': channel_id,
-                            'channel_name': item['snippet']['title'],
-                            'description': item['snippet']['description'][:500] if item['snippet']['description'] else ''
-                        })
-                
-                next_page_token = response.get('nextPageToken')
-                if not next_page_token:
-                    break
-                    
-            except HttpError as e:
-                print(f"API Error: {e}")
+    __slots__ = ('max_videos', 'max_age_days', 'min_age_days')
+    
+    def __init__(self, max_videos=RECENT_VIDEOS_PER_CHANNEL, max_age_days=RECENT_VIDEOS_MAX_AGE_DAYS,
+                 min_age_days=RECENT_VIDEOS_MIN_AGE_DAYS):
+        self.max_videos = max_videos
+        self.max_age_days = max_age_days
+        self.min_age_days = min_age_days
+    
+    def __repr__(self):
+        return (f"AnalyticsWindow(max_videos={self.max_videos}, max_age_days={self.max_age_days}, "
+                f"min_age_days={self.min_age_days})")
+    
+    @property
+    def video_limit(self):
+        """Most videos one channel can need stats for"""
+        return min(self.max_videos or UPLOADS_SAMPLED, UPLOADS_SAMPLED)
+    
+    def _too_old(self, age):
+        return self.max_age_days is not None and age is not None and age > self.max_age_days
+    
+    def select(self, uploads, now):
+        """The in-window video IDs from [(video_id, published_at)], newest first"""
+        selected = []
+        for video_id, published_at in uploads:
+            age = age_days(published_at, now)
+            if self._too_old(age):
                 break
-            
-            time.sleep(0.1)
+            if self.min_age_days is not None and age is not None and age < self.min_age_days:
+                continue
+            selected.append(video_id)
+            if len(selected) >= self.video_limit:
+                break
+        return selected
+    
+    def summarize(self, uploads, videos, now):
+        """Analytics over a channel's in-window videos (VideoRecords, newest first).
         
-        return channels
+        Views per day is the median of each video's views per day since it was
+        published; uploads per week counts every sampled upload within max_age_days.
+        """
+        views = [v.views for v in videos]
+        per_day = [v.views / max(age_days(v.published_at, now) or 0, 1) for v in videos]
+        ages = [age_days(published_at, now) for _, published_at in uploads]
+        ages = [age for age in ages if age is not None and not self._too_old(age)]
+        return {
+            'Median Views (Raw)': int(median(views)) if views else 0,
+            'Views per Day': round(median(per_day), 1) if per_day else 0.0,
+            'Uploads per Week': round(len(ages) / max(max(ages), 1) * 7, 2) if ages else 0.0,
+            'Last Upload (Days)': round(min(ages), 1) if ages else None,
+            'Recent Videos': len(videos),
+            'Recent Views': sum(views),
+            'Recent Likes': sum(v.likes for v in videos),
+            'Recent Comments': sum(v.comments for v in videos)
+        }
+
+
+class VideoRecord:
+    """Video statistics, holding only the fields the finder reads"""
     
-    def get_channel_stats(self, channel_ids):
-        """Get detailed statistics for a list of channel IDs"""
-        stats = {}
+    __slots__ = ('video_id', 'title', 'views', 'likes', 'comments', 'published_at')
+    
+    def __init__(self, video_id, title='', views=0, likes=0, comments=0, published_at=''):
+        self.video_id = video_id
+        self.title = title
+        self.views = views
+        self.likes = likes
+        self.comments = comments
+        self.published_at = published_at
+    
+    @classmethod
+    def from_api(cls, item):
+        """Build a record from a videos().list item"""
+        statistics = item.get('statistics', {})
+        snippet = item.get('snippet', {})
+        return cls(
+            item['id'],
+            title=snippet.get('title', ''),
+            views=int(statistics.get('viewCount', 0)),
+            likes=int(statistics.get('likeCount', 0)),
+            comments=int(statistics.get('commentCount', 0)),
+            published_at=snippet.get('publishedAt', '')
+        )
+    
+    def to_row(self):
+        return [getattr(self, field) for field in self.__slots__]
+    
+    @classmethod
+    def from_row(cls, row):
+        return cls(*row)
+
+
+class ApiCache:
+    """SQLite-backed cache of API results with per-resource TTLs.
+    
+    Entries are keyed by (kind, key), e.g. ('search', query) or ('channel', channel_id).
+    Once the cache holds more than max_entries rows, the least recently used ones are evicted.
+    Bump SCHEMA_VERSION when the stored record layout changes; older entries are dropped.
+    """
+    
+    SCHEMA_VERSION = 2
+    
+    def __init__(self, path=CACHE_PATH, ttls=None, max_entries=CACHE_MAX_ENTRIES):
+        self.path = path
+        self.ttls = dict(CACHE_TTLS, **(ttls or {}))
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._writes_since_evict = 0
+        self._lock = threading.Lock()
+        # Worker processes of a distributed run share one cache file
+        self.conn = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS cache (
+                kind TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (kind, key)
+            )"""
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache (accessed_at)")
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+            self.conn.execute("DELETE FROM cache")
+            self.conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        self.conn.commit()
+    
+    def get(self, kind, key):
+        """Return the cached value for key, or None if missing or stale"""
+        return self.get_many(kind, [key]).get(key)
+    
+    def get_many(self, kind, keys):
+        """Return {key: value} for every fresh cached key"""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
         
-        for i in range(0, len(channel_ids), 50):
-            batch = channel_ids[i:i+50]
-            try:
-                request = self.youtube.channels().list(
-                    part="statistics,snippet,contentDetails,brandingSettings",
-                    id=','.join(batch)
-                )
-                response = request.execute()
-                
-                for item in response.get('items', []):
-                    channel_id = item['id']
-                    statistics = item.get('statistics', {})
-                    snippet = item.get('snippet', {})
-                    branding = item.get('brandingSettings', {}).get('channel', {})
-                    
-                    # Get custom URL
-                    custom_url = snippet.get('customUrl', '')
-                    if custom_url:
-                        channel_url = f"https://www.youtube.com/{custom_url}"
-                    else:
-                        channel_url = f"https://www.youtube.com/channel/{channel_id}"
-                    
-                    stats[channel_id] = {
-                        'subscribers': int(statistics.get('subscriberCount', 0)),
-                        'total_views': int(statistics.get('viewCount', 0)),
-                        'video_count': int(statistics.get('videoCount', 0)),
-                        'channel_url': channel_url,
-                        'custom_url': custom_url,
-                        'country': snippet.get('country', 'Unknown'),
-                        'description': snippet.get('description', '')[:500],
-                        'keywords': branding.get('keywords', ''),
-                        'published_at': snippet.get('publishedAt', '')
-                    }
-                    
-            except HttpError as e:
-                print(f"API Error getting stats: {e}")
+        now = time.time()
+        min_fetched_at = now - self.ttls.get(kind, 0)
+        found = {}
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                batch = keys[i:i+500]
+                placeholders = ','.join('?' * len(batch))
+                rows = self.conn.execute(
+                    f"SELECT key, value FROM cache WHERE kind = ? AND fetched_at >= ? AND key IN ({placeholders})",
+                    [kind, min_fetched_at, *batch]
+                ).fetchall()
+                for key, value in rows:
+                    found[key] = json.loads(value)
             
-            time.sleep(0.1)
+            if found:
+                self.conn.executemany(
+                    "UPDATE cache SET accessed_at = ? WHERE kind = ? AND key = ?",
+                    [(now, kind, key) for key in found]
+                )
+                self.conn.commit()
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
         
-        return stats
+        return found
     
-    def get_recent_videos_stats(self, channel_id, num_videos=10):
-        """Get statistics from recent videos including avg views"""
-        try:
-            # Get uploads playlist
-            request = self.youtube.channels().list(
-                part="contentDetails",
-                id=channel_id
+    def put(self, kind, key, value):
+        """Store a single value"""
+        self.put_many(kind, {key: value})
+    
+    def put_many(self, kind, items):
+        """Store {key: value} pairs, evicting old entries if the cache is over size"""
+        if not items:
+            return
+        
+        now = time.time()
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO cache (kind, key, value, fetched_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                [(kind, key, json.dumps(value), now, now) for key, value in items.items()]
             )
-            response = request.execute()
-            
-            if not response.get('items'):
-                return {'avg_views': 0, 'recent_videos': []}
-            
-            uploads_playlist = response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
-            
-            # Get recent videos
-            request = self.youtube.playlistItems().list(
-                part="contentDetails,snippet",
-                playlistId=uploads_playlist,
-                maxResults=num_videos
+            self._writes_since_evict += len(items)
+            # Counting rows is a full index scan, so only check the size periodically
+            if self._writes_since_evict >= 1000:
+                self._evict()
+            self.conn.commit()
+    
+    def _evict(self):
+        """Drop least recently used entries beyond max_entries (caller holds the lock)"""
+        self._writes_since_evict = 0
+        count = self.conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self.conn.execute(
+                "DELETE FROM cache WHERE rowid IN (SELECT rowid FROM cache ORDER BY accessed_at LIMIT ?)",
+                (excess,)
             )
-            response = request.execute()
-            
-            video_ids = [item['contentDetails']['videoId'] for item in response.get('items', [])]
-            
-            if not video_ids:
-                return {'avg_views': 0, 'recent_videos': []}
-            
-            # Get video statistics
-            request = self.youtube.videos().list(
-                part="statistics,snippet,contentDetails",
-                id=','.join(video_ids)
+    
+    def items(self, kind):
+        """Yield every cached (key, value) of a kind, stale or not"""
+        with self._lock:
+            rows = self.conn.execute("SELECT key, value FROM cache WHERE kind = ?", (kind,)).fetchall()
+        for key, value in rows:
+            yield key, json.loads(value)
+    
+    def close(self):
+        with self._lock:
+            self._evict()
+            self.conn.commit()
+            self.conn.close()
+
+
+class ChannelIndex:
+    """Persistent full-text index (SQLite FTS5, BM25 ranking) over every channel fetched.
+    
+    Names come from search results, descriptions and keywords from channels().list
+    and titles from videos().list. Each text column is updated only when it changes,
+    and several processes may share the file.
+    """
+    
+    # BM25 weights of the name, description, keywords and videos columns
+    WEIGHTS = (4.0, 1.0, 2.0, 1.5)
+    
+    def __init__(self, path=INDEX_PATH, timeout=60):
+        self.path = path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(
+            """CREATE TABLE IF NOT EXISTS docs (
+                id INTEGER PRIMARY KEY,
+                channel_id TEXT NOT NULL UNIQUE,
+                name TEXT NOT NULL DEFAULT '',
+                description TEXT NOT NULL DEFAULT '',
+                keywords TEXT NOT NULL DEFAULT '',
+                videos TEXT NOT NULL DEFAULT ''
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS docs_fts USING fts5(
+                name, description, keywords, videos,
+                content='docs', content_rowid='id', tokenize='porter unicode61'
+            );
+            CREATE TRIGGER IF NOT EXISTS docs_insert AFTER INSERT ON docs BEGIN
+                INSERT INTO docs_fts (rowid, name, description, keywords, videos)
+                VALUES (new.id, new.name, new.description, new.keywords, new.videos);
+            END;
+            CREATE TRIGGER IF NOT EXISTS docs_update AFTER UPDATE ON docs BEGIN
+                INSERT INTO docs_fts (docs_fts, rowid, name, description, keywords, videos)
+                VALUES ('delete', old.id, old.name, old.description, old.keywords, old.videos);
+                INSERT INTO docs_fts (rowid, name, description, keywords, videos)
+                VALUES (new.id, new.name, new.description, new.keywords, new.videos);
+            END;"""
+        )
+    
+    def __len__(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+    
+    def _upsert(self, columns, rows):
+        """Set text columns for [(channel_id, *values)], skipping rows that are unchanged"""
+        if not rows:
+            return
+        updates = ', '.join(f"{column} = excluded.{column}" for column in columns)
+        changed = ' OR '.join(f"{column} != excluded.{column}" for column in columns)
+        with self._lock:
+            self.conn.executemany(
+                f"INSERT INTO docs (channel_id, {', '.join(columns)}) VALUES (?{', ?' * len(columns)}) "
+                f"ON CONFLICT(channel_id) DO UPDATE SET {updates} WHERE {changed}",
+                rows
             )
-            response = request.execute()
-            
-            videos_data = []
-            views = []
-            for item in response.get('items', []):
-                video_stats = item.get('statistics', {})
-                view_count = int(video_stats.get('viewCount', 0))
-                views.append(view_count)
-                videos_data.append({
-                    'title': item['snippet']['title'],
-                    'views': view_count,
-                    'likes': int(video_stats.get('likeCount', 0)),
-                    'comments': int(video_stats.get('commentCount', 0)),
-                    'published_at': item['snippet']['publishedAt']
-                })
-            
-            avg_views = int(sum(views) / len(views)) if views else 0
-            
+            self.conn.commit()
+    
+    def add_names(self, names):
+        """Index {channel_id: channel name}"""
+        self._upsert(['name'], [(cid, name or '') for cid, name in names.items()])
+    
+    def add_channels(self, records):
+        """Index the description and keywords of {channel_id: ChannelRecord}"""
+        self._upsert(['description', 'keywords'],
+                     [(cid, record.description or '', record.keywords or '') for cid, record in records.items()])
+    
+    def add_videos(self, titles):
+        """Index {channel_id: [recent video titles]}"""
+        self._upsert(['videos'], [(cid, '\n'.join(t for t in channel_titles if t))
+                                  for cid, channel_titles in titles.items() if channel_titles])
+    
+    def search(self, query, limit=LOCAL_SEARCH_LIMIT):
+        """Return [(channel_id, name)] of channels matching query, best first.
+        
+        Channels matching every word come first, ranked by BM25. They are followed by
+        channels matching some of the words whose score is at least
+        LOCAL_PARTIAL_MATCH_SCORE of the best full match, so a rare word can still
+        match on its own but a common one like "tutorial" can't.
+        """
+        terms = re.findall(r'\w+', query.lower())
+        if not terms:
+            return []
+        weights = ', '.join(str(weight) for weight in self.WEIGHTS)
+        sql = (f"SELECT docs.channel_id, docs.name, bm25(docs_fts, {weights}) AS score "
+               f"FROM docs_fts JOIN docs ON docs.id = docs_fts.rowid WHERE docs_fts MATCH ? ")
+        with self._lock:
+            matches = self.conn.execute(
+                sql + "ORDER BY score LIMIT ?", (' '.join(f'"{term}"' for term in terms), limit)
+            ).fetchall()
+            if matches and len(matches) < limit and len(terms) > 1:
+                # BM25 scores are negative: better matches score lower
+                partial = self.conn.execute(
+                    sql + "AND score <= ? ORDER BY score LIMIT ?",
+                    (' OR '.join(f'"{term}"' for term in terms), matches[0][2] * LOCAL_PARTIAL_MATCH_SCORE, limit)
+                ).fetchall()
+                found = {channel_id for channel_id, _, _ in matches}
+                matches += [match for match in partial if match[0] not in found][:limit - len(matches)]
+        return [(channel_id, name) for channel_id, name, _ in matches]
+    
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+class CassetteMissError(Exception):
+    """Raised in replay mode for a request that was never recorded"""
+
+
+class Cassette:
+    """Compact on-disk archive of API responses for record/replay runs.
+    
+    Responses are zlib-compressed JSON in SQLite, keyed by a SHA-1 request signature
+    (endpoint plus sorted parameters, API key excluded), so replay lookups are O(1).
+    channels.list and videos.list items are stored per ID, so a replay that batches
+    IDs differently from the recorded session still finds every item.
+    """
+    
+    BATCH_ENDPOINTS = ("channels.list", "videos.list")
+    
+    def __init__(self, path, mode="replay"):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Cassette mode must be 'record' or 'replay', not {mode!r}")
+        if mode == "replay" and not os.path.exists(path):
+            raise FileNotFoundError(f"No cassette at {path}")
+        self.path = path
+        self.mode = mode
+        self.recorded = 0
+        self.replayed = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                signature BLOB PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                body BLOB NOT NULL
+            ) WITHOUT ROWID"""
+        )
+        self.conn.commit()
+    
+    @staticmethod
+    def signature(endpoint, params, item_id=None):
+        canonical = sorted(
+            (k, str(v)) for k, v in params.items()
+            if v is not None and k not in ('key', 'id')
+        )
+        if 'id' in params and item_id is None:
+            canonical.append(('id', str(params['id'])))
+        return hashlib.sha1(json.dumps([endpoint, canonical, item_id]).encode('utf-8')).digest()
+    
+    def record(self, endpoint, params, response):
+        rows = []
+        if endpoint in self.BATCH_ENDPOINTS and params.get('id'):
+            items = {item['id']: item for item in response.get('items', [])}
+            # Requested IDs the API didn't return are stored as null so replay returns nothing for them
+            for item_id in str(params['id']).split(','):
+                rows.append((self.signature(endpoint, params, item_id), endpoint, items.get(item_id)))
+        else:
+            rows.append((self.signature(endpoint, params), endpoint, response))
+        
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO responses (signature, endpoint, body) VALUES (?, ?, ?)",
+                [(sig, ep, zlib.compress(json.dumps(body).encode('utf-8'))) for sig, ep, body in rows]
+            )
+            self.recorded += 1
+            if self.recorded % 100 == 0:
+                self.conn.commit()
+    
+    def _lookup(self, signature):
+        row = self.conn.execute("SELECT body FROM responses WHERE signature = ?", (signature,)).fetchone()
+        if row is None:
+            raise KeyError(signature)
+        return json.loads(zlib.decompress(row[0]))
+    
+    def replay(self, endpoint, params):
+        """Return the recorded response, or raise CassetteMissError"""
+        with self._lock:
+            try:
+                if endpoint in self.BATCH_ENDPOINTS and params.get('id'):
+                    items = [
+                        self._lookup(self.signature(endpoint, params, item_id))
+                        for item_id in str(params['id']).split(',')
+                    ]
+                    response = {'items': [item for item in items if item is not None]}
+                else:
+                    response = self._lookup(self.signature(endpoint, params))
+            except KeyError:
+                self.misses += 1
+                raise CassetteMissError(f"{endpoint} request not in cassette {self.path}")
+            self.replayed += 1
+        return response
+    
+    def close(self):
+        with self._lock:
+            self.conn.commit()
+            self.conn.close()
+
+
+class QuotaExhaustedError(Exception):
+    """Raised when the API reports that the daily quota is used up"""
+
+
+class TokenBucket:
+    """Thread-safe token bucket: sustained `rate` calls per second with bursts up to `burst`"""
+    
+    def __init__(self, rate=RATE_LIMIT_QPS, burst=RATE_LIMIT_BURST):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def http_error_reason(error):
+    """Extract the API error reason (e.g. 'quotaExceeded') from an HttpError"""
+    try:
+        details = json.loads(error.content.decode('utf-8'))['error']
+        errors = details.get('errors') or [{}]
+        return errors[0].get('reason') or details.get('status', '')
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return ''
+
+
+class Instrumentation:
+    """Latency histograms, error counts, bytes and per-keyword yield for a run.
+    
+    API calls are tracked per endpoint and pipeline stages (search, stats, recent
+    videos, why-reason generation, export) per stage name. Each keyword tallies its
+    candidates by outcome so dry or wasteful keywords stand out in the report.
+    """
+    
+    YIELD_OUTCOMES = ('candidates', 'already_seen', 'previously_rejected', 'out_of_tier',
+                      'tier_full', 'no_recent_uploads', 'low_views', 'accepted')
+    
+    def __init__(self):
+        self.calls = defaultdict(self._timing)
+        self.stages = defaultdict(self._timing)
+        self.errors = defaultdict(int)
+        self.keywords = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _timing():
+        return {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'bytes': 0, 'units': 0,
+                'histogram': [0] * len(LATENCY_BUCKETS_MS)}
+    
+    @staticmethod
+    def _observe(timing, elapsed_ms):
+        timing['count'] += 1
+        timing['total_ms'] += elapsed_ms
+        timing['max_ms'] = max(timing['max_ms'], elapsed_ms)
+        timing['histogram'][bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+    
+    def record_call(self, endpoint, elapsed_ms, nbytes, units, keyword=None):
+        with self._lock:
+            timing = self.calls[endpoint]
+            self._observe(timing, elapsed_ms)
+            timing['bytes'] += nbytes
+            timing['units'] += units
+            if keyword is not None:
+                self.keywords[keyword]['units'] += units
+                self.keywords[keyword]['calls'] += 1
+    
+    def keyword_units(self, keyword):
+        return self.keyword_outcome(keyword, 'units')
+    
+    def keyword_outcome(self, keyword, outcome):
+        with self._lock:
+            return self.keywords[keyword][outcome] if keyword in self.keywords else 0
+    
+    def record_error(self, endpoint, reason):
+        with self._lock:
+            self.errors[f"{endpoint}:{reason or 'unknown'}"] += 1
+    
+    @contextlib.contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                self._observe(self.stages[name], elapsed_ms)
+    
+    def keyword_yield(self, category, keyword, **counts):
+        """Add outcome counts for a keyword, e.g. keyword_yield(cat, kw, out_of_tier=3)"""
+        with self._lock:
+            entry = self.keywords.setdefault(
+                keyword, dict({'category': category, 'units': 0, 'calls': 0},
+                              **{outcome: 0 for outcome in self.YIELD_OUTCOMES})
+            )
+            for outcome, count in counts.items():
+                entry[outcome] += count
+    
+    def to_dict(self):
+        def finish(timings):
             return {
-                'avg_views': avg_views,
-                'recent_videos': videos_data
+                name: dict(t, mean_ms=round(t['total_ms'] / t['count'], 2) if t['count'] else 0.0,
+                           total_ms=round(t['total_ms'], 2), max_ms=round(t['max_ms'], 2))
+                for name, t in timings.items()
             }
-            
-        except HttpError as e:
-            return {'avg_views': 0, 'recent_videos': []}
-    
-    def check_partnership_signals(self, channel_stats, recent_videos):
-        """Check for signals that indicate partnership receptiveness"""
-        signals = []
-        
-        description = channel_stats.get('description', '').lower()
-        
-        # Check for business contact info
-        if any(word in description for word in ['business', 'contact', 'email', 'collaboration', 'sponsor', 'partnership']):
-            signals.append("Has business contact info")
-        
-        # Check for consistent uploads (if we have video dates)
-        if recent_videos:
-            signals.append(f"Active channel ({len(recent_videos)} recent videos)")
-        
-        # Check engagement rate
-        if channel_stats.get('subscribers', 0) > 0:
-            avg_views = sum(v.get('views', 0) for v in recent_videos) / len(recent_videos) if recent_videos else 0
-            engagement_rate = avg_views / channel_stats['subscribers'] * 100
-            if engagement_rate > 10:
-                signals.append("High engagement (>10%)")
-            elif engagement_rate > 5:
-                signals.append("Good engagement (>5%)")
-        
-        return signals
-    
-    def generate_why_reason(self, creator_data, category, recent_videos):
-        """Generate a comprehensive 'Why This Creator' reason"""
-        subs = creator_data['Subscribers']
-        avg_views = creator_data['Avg Views (Raw)']
-        tier = creator_data['Subscriber Category']
-        
-        # Calculate engagement rate
-        engagement_rate = (avg_views / subs * 100) if subs > 0 else 0
-        
-        engagement_desc = ""
-        if engagement_rate > 10:
-            engagement_desc = "Very high engagement rate"
-        elif engagement_rate > 5:
-            engagement_desc = "Strong engagement rate"
-        elif engagement_rate > 2:
-            engagement_desc = "Good engagement rate"
-        else:
-            engagement_desc = "Growing channel"
-        
-        # Category-specific reasons
-        category_reasons = {
-            "Tech & AI Content Creators": f"Reviews AI tools and technology. {engagement_desc}. Audience actively seeks AI video tools.",
-            "Filmmakers & Cinematographers": f"Creates filmmaking content. {engagement_desc}. Audience would benefit from AI video generation for production.",
-            "VFX & Visual Effects Artists": f"Specializes in visual effects. {engagement_desc}. AI can accelerate complex effects and replace expensive stock footage.",
-            "Video Editors & Post-Production Specialists": f"Professional editing tutorials. {engagement_desc}. Can demonstrate AI tools to professional audience.",
-            "Music Video Producers & Digital Artists": f"Creates music/visual content. {engagement_desc}. AI video tools can help produce music videos efficiently.",
-            "Animation & Motion Graphics Artists": f"Motion graphics/animation creator. {engagement_desc}. AI can significantly speed up animation workflow."
-        }
         
-        base_reason = category_reasons.get(category, f"Active creator. {engagement_desc}.")
+        with self._lock:
+            return {
+                'latency_buckets_ms': [b if b != float('inf') else 'inf' for b in LATENCY_BUCKETS_MS],
+                'api_calls': finish(self.calls),
+                'stages': finish(self.stages),
+                'errors': dict(self.errors),
+                'keywords': {k: dict(v) for k, v in self.keywords.items()}
+            }
+    
+    def summary(self, top=5):
+        """Human-readable report of the slowest stages and the best and worst keywords"""
+        data = self.to_dict()
+        lines = ["⏱️  Stages:"]
+        for name, t in sorted(data['stages'].items(), key=lambda kv: -kv[1]['total_ms']):
+            lines.append(f"   {name:<15} {t['count']:>6}x  mean {t['mean_ms']:>8.1f} ms  "
+                         f"max {t['max_ms']:>8.1f} ms  total {t['total_ms'] / 1000:>7.1f} s")
+        lines.append("🌐 API calls:")
+        for name, t in data['api_calls'].items():
+            lines.append(f"   {name:<19} {t['count']:>6}x  mean {t['mean_ms']:>8.1f} ms  "
+                         f"{t['bytes'] / 1e6:>7.2f} MB  {t['units']:>6} units")
+        if data['errors']:
+            lines.append(f"⚠️  Errors: {data['errors']}")
         
-        # Add tier-specific note
-        tier_notes = {
-            "Nano (1K-10K subs)": "Highly responsive to partnerships, affordable for scale.",
-            "Micro (10K-100K subs)": "Sweet spot for authentic partnerships with good reach.",
-            "Mid-Tier (100K-500K subs)": "Credibility builder, validates product for larger audiences.",
-            "Macro (500K-1M+ subs)": "Brand amplification and market-wide visibility."
+        keywords = [(k, v) for k, v in data['keywords'].items() if v['units']]
+        if keywords:
+            def units_per_accept(item):
+                return item[1]['units'] / item[1]['accepted'] if item[1]['accepted'] else float('inf')
+            keywords.sort(key=units_per_accept)
+            lines.append("🎯 Best keywords (units per accepted creator):")
+            for keyword, v in keywords[:top]:
+                lines.append(f"   {keyword:<32} {units_per_accept((keyword, v)):>7.1f}  ({v['accepted']} accepted)")
+            lines.append("🕳️  Worst keywords:")
+            for keyword, v in keywords[-top:][::-1]:
+                lines.append(f"   {keyword:<32} {v['units']:>5} units, {v['candidates']} found, {v['accepted']} accepted, "
+                             f"{v['already_seen']} seen, {v['out_of_tier']} out of tier, "
+                             f"{v['tier_full']} tier full, {v['no_recent_uploads']} no recent uploads, "
+                             f"{v['low_views']} low views")
+        return "\n".join(lines)
+
+
+class QuotaMeter:
+    """Thread-safe running count of quota units spent per endpoint and per category.
+    
+    With a budget set, keywords reserve their worst-case cost before starting so a run
+    stops cleanly instead of dying on quota errors halfway through a keyword.
+    """
+    
+    def __init__(self, budget=None, allocations=None):
+        self.budget = budget
+        self.allocations = dict(allocations or {})
+        self.units_by_endpoint = defaultdict(int)
+        self.calls_by_endpoint = defaultdict(int)
+        self.units_by_category = defaultdict(int)
+        self._reserved = defaultdict(int)
+        self._lock = threading.Lock()
+    
+    @property
+    def total_units(self):
+        return sum(self.units_by_endpoint.values())
+    
+    def charge(self, endpoint, category=None):
+        """Record one call to endpoint"""
+        units = QUOTA_COSTS.get(endpoint, 1)
+        with self._lock:
+            self.units_by_endpoint[endpoint] += units
+            self.calls_by_endpoint[endpoint] += 1
+            self.units_by_category[category] += units
+        return units
+    
+    def try_reserve(self, category, units):
+        """Reserve units for upcoming work; False if the budget or category allocation can't cover it"""
+        with self._lock:
+            if self.budget is not None:
+                committed = self.total_units + sum(self._reserved.values())
+                if committed + units > self.budget:
+                    return False
+            if category in self.allocations:
+                committed = self.units_by_category[category] + self._reserved[category]
+                if committed + units > self.allocations[category]:
+                    return False
+            self._reserved[category] += units
+            return True
+    
+    def release(self, category, units):
+        """Return a reservation once the work it covered has been charged"""
+        with self._lock:
+            self._reserved[category] -= units
+    
+    def reallocate(self, finished_category, deficits):
+        """Hand a finished category's unspent allocation to the categories still short"""
+        with self._lock:
+            if finished_category not in self.allocations:
+                return
+            spent = self.units_by_category[finished_category]
+            unspent = max(0, self.allocations[finished_category] - spent)
+            self.allocations[finished_category] = spent
+            total_deficit = sum(deficits.values())
+            if not unspent or not total_deficit:
+                return
+            for category, deficit in deficits.items():
+                self.allocations[category] = self.allocations.get(category, 0) + unspent * deficit // total_deficit
+
+
+class CreatorSink:
+    """Append-only JSONL stream of accepted creators.
+    
+    Each creator is flushed as soon as it is accepted, so nothing is lost on a crash
+    and the run never has to hold every creator in memory.
+    """
+    
+    def __init__(self, path, append=False):
+        self.path = path
+        self.count = 0
+        self._lock = threading.Lock()
+        if append and os.path.exists(path):
+            self.count = sum(1 for _ in self.read_file(path))
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8')
+    
+    def write(self, creator):
+        line = json.dumps(creator, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+            self.count += 1
+    
+    def read(self):
+        """Yield every creator written so far"""
+        return self.read_file(self.path)
+    
+    @staticmethod
+    def read_file(path):
+        """Yield every creator in a JSONL stream file"""
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                # A crash mid-write can leave a truncated last line
+                if line.endswith('\n'):
+                    yield json.loads(line)
+    
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class RejectionIndex:
+    """Why, when and with which numbers each channel was rejected.
+    
+    Out-of-tier channels are skipped outright by later keywords; tier-full channels
+    are skipped while their last-known tier is still full, and low-view channels or
+    ones with no uploads in the analytics window while the window is the same.
+    Backed by the API cache when one is configured, so rejections outlive the run.
+    """
+    
+    PERMANENT_REASONS = ('out_of_tier',)
+    # Judged on recent-video analytics, so they only hold for the window that produced them
+    WINDOW_REASONS = ('no_recent_uploads', 'low_views')
+    
+    def __init__(self, cache=None, window=None):
+        self.cache = cache
+        # repr() of the AnalyticsWindow that WINDOW_REASONS rejections are tied to
+        self.window = window
+        self.entries = {}
+        self.skips = defaultdict(int)
+        self._lock = threading.Lock()
+    
+    def record(self, channel_id, reason, subscribers=None, avg_views=None, tier=None):
+        entry = {
+            'reason': reason,
+            'rejected_at': time.time(),
+            'subscribers': subscribers,
+            'avg_views': avg_views,
+            'tier': tier
         }
+        if reason in self.WINDOW_REASONS:
+            entry['window'] = self.window
+        with self._lock:
+            self.entries[channel_id] = entry
+        if self.cache:
+            self.cache.put('rejection', channel_id, entry)
+    
+    def prefetch(self, channel_ids):
+        """Load cached rejections for channel_ids from earlier runs"""
+        if not self.cache:
+            return
+        with self._lock:
+            missing = [cid for cid in channel_ids if cid not in self.entries]
+        found = self.cache.get_many('rejection', missing)
+        with self._lock:
+            for channel_id, entry in found.items():
+                self.entries.setdefault(channel_id, entry)
+    
+    def skip_reason(self, channel_id, tier_counts_local, target_per_tier):
+        """Return the reason to skip a channel without fetching it, or None"""
+        entry = self.entries.get(channel_id)
+        if entry is None:
+            return None
+        
+        reason = entry['reason']
+        if reason in self.PERMANENT_REASONS:
+            skip = reason
+        elif reason == 'tier_full':
+            tier = entry['tier']
+            skip = reason if tier_counts_local[tier] >= target_per_tier.get(tier, 0) else None
+        elif reason in self.WINDOW_REASONS:
+            skip = reason if entry.get('window') == self.window else None
+        else:
+            skip = None
         
-        return f"{base_reason} {tier_notes.get(tier, '')}"
+        if skip:
+            with self._lock:
+                self.skips[skip] += 1
+        return skip
+
+
+class KeywordScheduler:
+    """Learns each keyword's yield and picks the next keyword to search.
     
-    def find_creators_for_category(self, category_name, category_config):
-        """Find creators for a specific category with tier distribution"""
-        print(f"\n🔍 Searching category: {category_name}")
-        print(f"   Target per tier: {category_config['target_per_tier']}")
+    Yield is the quota units spent on a keyword and the creators it got accepted per
+    tier, summed over every page searched in every run. It is backed by the API cache
+    when one is configured, so later runs start with what earlier ones learned.
+    Keywords are ranked by expected accepted creators per quota unit, counting only
+    tiers the category still needs; keywords with no history start from an optimistic
+    prior so they are tried before ones known to run dry.
+    """
+    
+    def __init__(self, cache=None):
+        self.cache = cache
+        self.stats = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(category_name, keyword):
+        return f"{category_name}|{keyword}"
+    
+    def load(self, category_name, keywords):
+        """Load the yield history of a category's keywords from earlier runs"""
+        if not self.cache:
+            return
+        keys = [self._key(category_name, keyword) for keyword in keywords]
+        found = self.cache.get_many('keyword', [k for k in keys if k not in self.stats])
+        with self._lock:
+            for key, entry in found.items():
+                self.stats.setdefault(key, entry)
+    
+    def record_page(self, category_name, keyword, units, accepted):
+        """Add one searched page: quota units spent and {tier: creators accepted}"""
+        key = self._key(category_name, keyword)
+        with self._lock:
+            entry = self.stats.setdefault(key, {'units': 0, 'pages': 0, 'accepted': {}})
+            entry['units'] += units
+            entry['pages'] += 1
+            for tier, count in accepted.items():
+                entry['accepted'][tier] = entry['accepted'].get(tier, 0) + count
+            snapshot = json.loads(json.dumps(entry))
+        if self.cache:
+            self.cache.put('keyword', key, snapshot)
+    
+    def expected_yield(self, category_name, keyword, short_tiers):
+        """Expected creators accepted into short_tiers per quota unit"""
+        entry = self.stats.get(self._key(category_name, keyword), {'units': 0, 'accepted': {}})
+        accepted = sum(entry['accepted'].get(tier, 0) for tier in short_tiers)
+        return (
+            (accepted + KEYWORD_PRIOR_YIELD * KEYWORD_PRIOR_UNITS)
+            / (entry['units'] + KEYWORD_PRIOR_UNITS)
+        )
+    
+    def next_keyword(self, category_name, keywords, tier_counts_local, target_per_tier):
+        """The keyword with the best expected yield for the tiers still short (ties keep list order)"""
+        short_tiers = [
+            tier for tier in TIER_CONFIG.keys()
+            if tier_counts_local[tier] < target_per_tier.get(tier, 0)
+        ]
+        with self._lock:
+            return max(keywords, key=lambda k: self.expected_yield(category_name, k, short_tiers))
+
+
+class CandidatePool:
+    """Qualified channels found by any category's keywords, shared across categories.
+    
+    Stats and recent videos are fetched at most once per channel per run; every
+    category whose keywords surface a qualified channel becomes one of its options,
+    with a copy of the channel's row under that category.
+    assign() fills every category's target_per_tier from the whole pool, instead of
+    giving each channel to whichever category happened to find it first.
+    
+    scorer maps a list of creator rows to their partnership scores; assign() scores
+    channels added since the last assignment in one call and fills tiers best first.
+    """
+    
+    def __init__(self, scorer=None):
+        self.entries = {}  # channel_id -> tier, avg views, score, {category: creator row}, {category: hits}
+        self.stats = {}  # channel_id -> ChannelRecord, for channels turned away by a full tier
+        self.sink = None
+        self.scorer = scorer
+        self._assignment = None
+        self._lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def option(self, channel_id, category_name):
+        """A qualified channel's row for another category, or None if it has not qualified"""
+        entry = self.entries.get(channel_id)
+        if entry is None:
+            return None
+        return dict(next(iter(entry['rows'].values())), **{'Content Category': category_name})
+    
+    def add(self, creator_data):
+        """Offer a qualified channel to creator_data's category.
         
-        category_creators = []
-        tier_counts_local = {tier: 0 for tier in TIER_CONFIG.keys()}
-        keywords = category_config['keywords']
-        target_per_tier = category_config['target_per_tier']
+        Returns True if the category is a new option for the channel.
+        """
+        channel_id = creator_data['Channel ID']
+        category_name = creator_data['Content Category']
+        with self._lock:
+            self.stats.pop(channel_id, None)
+            entry = self.entries.setdefault(channel_id, {
+                'tier': creator_data['Subscriber Category'],
+                'avg_views': creator_data['Avg Views (Raw)'],
+                'score': None,
+                'rows': {},
+                'hits': defaultdict(int)
+            })
+            entry['hits'][category_name] += 1
+            new_option = category_name not in entry['rows']
+            if new_option:
+                entry['rows'][category_name] = creator_data
+            self._assignment = None
+        if new_option and self.sink:
+            self.sink.write(creator_data)
+        return new_option
+    
+    def assign(self, targets):
+        """Return {category: [creator rows]} filling each category's targets from the pool.
         
-        for keyword in tqdm(keywords, desc="Keywords"):
-            # Check if we've met all tier targets for this category
-            all_targets_met = all(
-                tier_counts_local[tier] >= target_per_tier.get(tier, 0)
-                for tier in TIER_CONFIG.keys()
-            )
-            if all_targets_met:
-                break
+        Channels are placed best partnership score first (most watched first without
+        a scorer), so each tier keeps its top-scoring candidates rather than the first
+        found. Each goes into the option whose tier is furthest from its target; ties
+        go to the category whose keywords found it most.
+        """
+        with self._lock:
+            if self._assignment is not None:
+                return self._assignment
             
-            channels = self.search_channels(keyword, max_results=30)
+            unscored = [entry for entry in self.entries.values() if entry['score'] is None]
+            if unscored:
+                scores = (self.scorer([next(iter(entry['rows'].values())) for entry in unscored])
+                          if self.scorer else [0.0] * len(unscored))
+                for entry, score in zip(unscored, scores):
+                    entry['score'] = float(score)
             
-            if not channels:
-                continue
-            
-            # Get stats for found channels
-            channel_ids = [c['channel_id'] for c in channels]
-            stats = self.get_channel_stats(channel_ids)
-            
-            for channel in channels:
-                channel_id = channel['channel_id']
-                
-                if channel_id in self.seen_channel_ids:
-                    continue
-                
-                if channel_id not in stats:
+            order = {name: i for i, name in enumerate(targets)}
+            remaining = {name: dict(target_per_tier) for name, target_per_tier in targets.items()}
+            assignment = {name: [] for name in targets}
+            entries = sorted(
+                self.entries.items(),
+                key=lambda item: (-item[1]['score'], -item[1]['avg_views'], item[0])
+            )
+            for channel_id, entry in entries:
+                tier = entry['tier']
+                options = [name for name in entry['rows'] if remaining.get(name, {}).get(tier, 0) > 0]
+                if not options:
                     continue
+                best = max(options, key=lambda name: (
+                    remaining[name][tier] / targets[name][tier], entry['hits'][name], -order[name]
+                ))
+                remaining[best][tier] -= 1
+                assignment[best].append(entry['rows'][best])
+            
+            self._assignment = assignment
+            return assignment
+
+
+class KeywordTask:
+    """One category's keyword and the targets its vetting stages check against"""
+    
+    __slots__ = ('keyword', 'category', 'target_per_tier', 'tier_counts', 'stop_event')
+    
+    def __init__(self, keyword, category, target_per_tier, tier_counts, stop_event):
+        self.keyword = keyword
+        self.category = category
+        self.target_per_tier = target_per_tier
+        self.tier_counts = tier_counts
+        self.stop_event = stop_event
+
+
+class VetBatch:
+    """One page of search results moving through the vetting stages.
+    
+    Each stage narrows channels to those still in play and adds what it fetched;
+    added counts {tier: channels newly offered to the category}, and known the
+    page's channels that were already vetted this run.
+    """
+    
+    __slots__ = ('found', 'known', 'channels', 'stats', 'videos', 'added')
+    
+    def __init__(self, channels):
+        self.found = len(channels)
+        self.known = 0
+        self.channels = channels
+        self.stats = {}
+        self.videos = {}
+        self.added = defaultdict(int)
+
+
+class SharedStore:
+    """SQLite work queue and dedup store shared by a coordinator and its worker processes.
+    
+    The coordinator enqueues one work unit per (category, keyword) and the tier
+    targets. Workers claim units, claim each channel before vetting it so no two
+    workers fetch the same channel, and stream qualified candidates back here;
+    each worker assigns those candidates to categories to count tiers, so every
+    worker sees the others' progress. WAL mode and a busy timeout let many processes
+    (on one machine or a shared filesystem) use the same file.
+    """
+    
+    def __init__(self, path, timeout=60):
+        self.path = path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(
+            """CREATE TABLE IF NOT EXISTS work (
+                category TEXT NOT NULL,
+                keyword TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                worker TEXT,
+                claimed_at REAL,
+                PRIMARY KEY (category, keyword)
+            );
+            CREATE TABLE IF NOT EXISTS claims (
+                channel_id TEXT PRIMARY KEY,
+                worker TEXT NOT NULL,
+                claimed_at REAL NOT NULL
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS hits (
+                channel_id TEXT NOT NULL,
+                category TEXT NOT NULL,
+                PRIMARY KEY (channel_id, category)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS candidates (
+                channel_id TEXT NOT NULL,
+                category TEXT NOT NULL,
+                tier TEXT NOT NULL,
+                row TEXT NOT NULL,
+                PRIMARY KEY (channel_id, category)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_candidates_tier ON candidates (category, tier);
+            CREATE TABLE IF NOT EXISTS targets (
+                category TEXT NOT NULL,
+                tier TEXT NOT NULL,
+                target INTEGER NOT NULL,
+                PRIMARY KEY (category, tier)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;"""
+        )
+    
+    @contextlib.contextmanager
+    def _transaction(self):
+        # BEGIN IMMEDIATE takes the write lock up front, so read-then-write steps can't interleave
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+    
+    def setup(self, units, targets):
+        """Enqueue (category, keyword) units and tier targets; existing ones are kept, so a coordinator can restart"""
+        with self._transaction() as conn:
+            conn.executemany("INSERT OR IGNORE INTO work (category, keyword) VALUES (?, ?)", units)
+            conn.executemany(
+                "INSERT OR IGNORE INTO targets (category, tier, target) VALUES (?, ?, ?)",
+                [(name, tier, target) for name, tiers in targets.items() for tier, target in tiers.items()]
+            )
+            conn.execute("DELETE FROM state WHERE key = 'finished'")
+    
+    def next_unit(self, worker, lease=WORK_LEASE):
+        """Claim the next pending unit (or one whose worker's lease expired), or None"""
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT category, keyword FROM work WHERE status = 'pending' "
+                "OR (status = 'claimed' AND claimed_at < ?) ORDER BY rowid LIMIT 1",
+                (now - lease,)
+            ).fetchone()
+            if row:
+                conn.execute(
+                    "UPDATE work SET status = 'claimed', worker = ?, claimed_at = ? WHERE category = ? AND keyword = ?",
+                    (worker, now, *row)
+                )
+        return row
+    
+    def finish_unit(self, category_name, keyword, status):
+        """Mark a unit 'done', 'skipped' (its category's targets were met), 'limited', 'failed' or 'pending' again.
+        
+        'limited' units stopped short because a tier looked full at the time; 'failed'
+        ones hit an API error that outlasted every retry.
+        """
+        with self._transaction() as conn:
+            conn.execute("UPDATE work SET status = ? WHERE category = ? AND keyword = ?",
+                         (status, category_name, keyword))
+    
+    def claim(self, channel_ids, worker, category_name):
+        """Claim channels for vetting; returns the ids this call claimed.
+        
+        Every channel is also recorded as a hit for category_name, so a channel
+        another worker vets still becomes an option for this category.
+        """
+        claimed = set()
+        now = time.time()
+        with self._transaction() as conn:
+            conn.executemany("INSERT OR IGNORE INTO hits (channel_id, category) VALUES (?, ?)",
+                             [(channel_id, category_name) for channel_id in channel_ids])
+            for channel_id in channel_ids:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO claims (channel_id, worker, claimed_at) VALUES (?, ?, ?)",
+                    (channel_id, worker, now)
+                )
+                if cursor.rowcount:
+                    claimed.add(channel_id)
+        return claimed
+    
+    def release(self, channel_ids):
+        """Give up claims on channels rejected for a reason that may not hold for other categories"""
+        with self._transaction() as conn:
+            conn.executemany("DELETE FROM claims WHERE channel_id = ?", [(cid,) for cid in channel_ids])
+    
+    def write(self, creator_data):
+        """Store a qualified candidate (the CandidatePool sink interface)"""
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO candidates (channel_id, category, tier, row) VALUES (?, ?, ?, ?)",
+                (creator_data['Channel ID'], creator_data['Content Category'],
+                 creator_data['Subscriber Category'], json.dumps(creator_data, ensure_ascii=False))
+            )
+    
+    def targets(self):
+        targets = defaultdict(dict)
+        with self._lock:
+            for category_name, tier, target in self.conn.execute("SELECT category, tier, target FROM targets"):
+                targets[category_name][tier] = target
+        return dict(targets)
+    
+    def reopen(self, category_name):
+        """Requeue a category's skipped and limited units; returns the number requeued"""
+        with self._transaction() as conn:
+            return conn.execute(
+                "UPDATE work SET status = 'pending' WHERE category = ? AND status IN ('skipped', 'limited')",
+                (category_name,)
+            ).rowcount
+    
+    def progress(self):
+        """{status: units}"""
+        with self._lock:
+            return dict(self.conn.execute("SELECT status, COUNT(*) FROM work GROUP BY status").fetchall())
+    
+    def candidates(self):
+        with self._lock:
+            rows = self.conn.execute("SELECT row FROM candidates ORDER BY channel_id, category").fetchall()
+        return [json.loads(row) for row, in rows]
+    
+    def hits(self):
+        with self._lock:
+            return self.conn.execute("SELECT channel_id, category FROM hits").fetchall()
+    
+    def set_finished(self):
+        with self._transaction() as conn:
+            conn.execute("INSERT OR REPLACE INTO state (key, value) VALUES ('finished', '1')")
+    
+    def finished(self):
+        with self._lock:
+            return self.conn.execute("SELECT 1 FROM state WHERE key = 'finished'").fetchone() is not None
+    
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+class AsyncYouTubeClient:
+    """asyncio client for the four Data API endpoints the finder uses (requires aiohttp).
+    
+    Calls share one keep-alive connection pool and at most `concurrency` of them are
+    in flight at once. Responses are the same JSON dicts googleapiclient returns, and
+    HTTP errors are raised as googleapiclient HttpErrors so callers handle both alike.
+    Use `await client.call(...)` from asyncio code, or `execute(...)` from threads,
+    which runs the call on the client's own background event loop.
+    """
+    
+    PATHS = {
+        "search.list": "search",
+        "channels.list": "channels",
+        "playlistItems.list": "playlistItems",
+        "videos.list": "videos"
+    }
+    
+    def __init__(self, base_url=API_BASE_URL, concurrency=ASYNC_CONCURRENCY, timeout=30):
+        try:
+            aiohttp.load()
+        except ImportError:
+            raise ImportError("The async backend requires aiohttp: pip install aiohttp") from None
+        self.base_url = base_url.rstrip('/')
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._session = None
+        self._semaphore = None
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+    
+    async def _get_session(self):
+        if self._session is None:
+            import asyncio
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.concurrency, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                raise_for_status=False
+            )
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._session
+    
+    async def call(self, endpoint, api_key, if_none_match=None, **params):
+        """Issue one API call, e.g. call("videos.list", key, part="statistics", id="a,b").
+        
+        Returns None for a 304 when if_none_match is the resource's current ETag.
+        """
+        session = await self._get_session()
+        url = f"{self.base_url}/{self.PATHS[endpoint]}"
+        query = {k: str(v) for k, v in params.items() if v is not None}
+        query['key'] = api_key
+        headers = {'If-None-Match': if_none_match} if if_none_match else None
+        
+        async with self._semaphore:
+            try:
+                async with session.get(url, params=query, headers=headers) as resp:
+                    body = await resp.read()
+                    status = resp.status
+            except aiohttp.ClientError as e:
+                # Surface transport failures as OSError so they are retried like httplib2's
+                raise ConnectionError(f"{endpoint}: {e}") from e
+        
+        if status == 304:
+            return None
+        if status >= 400:
+            import httplib2
+            raise HttpError(httplib2.Response({'status': status}), body, uri=url)
+        return json.loads(body)
+    
+    async def search_list(self, api_key, **params):
+        return await self.call("search.list", api_key, **params)
+    
+    async def channels_list(self, api_key, **params):
+        return await self.call("channels.list", api_key, **params)
+    
+    async def playlist_items_list(self, api_key, **params):
+        return await self.call("playlistItems.list", api_key, **params)
+    
+    async def videos_list(self, api_key, **params):
+        return await self.call("videos.list", api_key, **params)
+    
+    def execute(self, endpoint, api_key, **params):
+        """Blocking call from any thread; many threads can have calls in flight at once"""
+        import asyncio
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+                self._thread.start()
+        future = asyncio.run_coroutine_threadsafe(self.call(endpoint, api_key, **params), self._loop)
+        return future.result()
+    
+    async def aclose(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    def close(self):
+        """Close the connection pool and stop the background loop, if started"""
+        with self._lock:
+            if self._loop is None:
+                return
+            import asyncio
+            asyncio.run_coroutine_threadsafe(self.aclose(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = None
+
+
+def next_quota_reset(now=None):
+    """Unix time of the next daily quota reset (midnight Pacific Time)"""
+    pacific = ZoneInfo("America/Los_Angeles")
+    now = now or datetime.now(pacific)
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=pacific)
+    return midnight.timestamp()
+
+
+_discovery = None
+_discovery_lock = threading.Lock()
+
+
+def discovery_document():
+    """The parsed YouTube Data API discovery document, loaded once per process.
+    
+    Read from the static copy bundled with google-api-python-client, or from
+    DISCOVERY_CACHE_PATH, which is fetched once if the installed version bundles none.
+    """
+    global _discovery
+    with _discovery_lock:
+        if _discovery is None:
+            with timing("discovery document"):
+                try:
+                    from googleapiclient.discovery_cache import get_static_doc
+                    document = get_static_doc('youtube', 'v3')
+                except ImportError:
+                    document = None
+                if document is None and os.path.exists(DISCOVERY_CACHE_PATH):
+                    with open(DISCOVERY_CACHE_PATH, encoding='utf-8') as f:
+                        document = f.read()
+                if document is None:
+                    import httplib2
+                    response, content = httplib2.Http(timeout=30).request(DISCOVERY_URL)
+                    if response.status != 200:
+                        raise ConnectionError(f"could not fetch the discovery document: HTTP {response.status}")
+                    document = content.decode('utf-8')
+                    with open(DISCOVERY_CACHE_PATH, 'w', encoding='utf-8') as f:
+                        f.write(document)
+                _discovery = json.loads(document)
+        return _discovery
+
+
+class ApiKeyPool:
+    """Round-robin pool of API keys, each with its own clients and quota meter.
+    
+    A key that reports quotaExceeded is taken out of rotation until its quota day resets.
+    """
+    
+    def __init__(self, api_keys, base_url=API_BASE_URL):
+        self.base_url = base_url
+        self.keys = [
+            {'key': key, 'meter': QuotaMeter(), 'exhausted_until': 0.0}
+            for key in dict.fromkeys(api_keys) if key
+        ]
+        self._next = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+    
+    def acquire(self):
+        """Return the next usable key, or raise QuotaExhaustedError if every key is spent"""
+        now = time.time()
+        with self._lock:
+            for _ in range(len(self.keys)):
+                key = self.keys[self._next % len(self.keys)]
+                self._next += 1
+                if key['exhausted_until'] <= now:
+                    return key
+        raise QuotaExhaustedError(f"all {len(self.keys)} API keys are out of quota")
+    
+    def client(self, key):
+        """API client for key on the current thread (googleapiclient clients are not thread-safe)"""
+        clients = getattr(self._local, 'clients', None)
+        if clients is None:
+            clients = self._local.clients = {}
+        if key['key'] not in clients:
+            with timing("import googleapiclient"):
+                from googleapiclient.discovery import build_from_document
+            with timing("build API client"):
+                clients[key['key']] = build_from_document(
+                    discovery_document(), developerKey=key['key'],
+                    client_options={'api_endpoint': self.base_url.rstrip('/') + '/'}
+                )
+        return clients[key['key']]
+    
+    def mark_exhausted(self, key):
+        with self._lock:
+            already = key['exhausted_until'] > time.time()
+            key['exhausted_until'] = next_quota_reset()
+        if not already:
+            print(f"\n🔑 API key ...{key['key'][-4:]} is out of quota, rotating to the next key")
+    
+    @property
+    def available(self):
+        now = time.time()
+        return sum(1 for key in self.keys if key['exhausted_until'] <= now)
+
+
+class YouTubeCreatorFinder:
+    def __init__(self, api_key, max_workers=MAX_WORKERS, category_workers=CATEGORY_WORKERS,
+                 cache=None, quota_budget=QUOTA_BUDGET, rate_limiter=None, max_retries=MAX_RETRIES,
+                 backend=API_BACKEND, api_base_url=API_BASE_URL, cassette=None, window=None, index=None):
+        # api_key may be a single key or a list of keys to rotate across
+        api_keys = [api_key] if isinstance(api_key, str) else list(api_key)
+        self.api_key = api_keys[0] if api_keys else None
+        self.keys = ApiKeyPool(api_keys, api_base_url)
+        # Record every response to, or replay every response from, a Cassette
+        self.cassette = cassette
+        if cassette:
+            # Keyword order and paging depend on thread timing, so cassette sessions run
+            # keywords and categories serially to replay exactly the recorded requests
+            max_workers = category_workers = 1
+        self.metrics = Instrumentation()
+        self.window = window or AnalyticsWindow()
+        self.max_workers = max_workers
+        self.category_workers = category_workers
+        self.cache = cache
+        # Local ChannelIndex searched before the API, and fed by every fetch
+        self.index = index
+        self.quota = QuotaMeter(quota_budget)
+        self.quota_exhausted = False
+        self.rate_limiter = rate_limiter or TokenBucket()
+        self.max_retries = max_retries
+        self.async_client = AsyncYouTubeClient(api_base_url) if backend == "async" else None
+        io_workers = ASYNC_CONCURRENCY if self.async_client else IO_WORKERS
+        self._io_pool = ThreadPoolExecutor(max_workers=io_workers)
+        self.rejections = RejectionIndex(cache, repr(self.window))
+        self.scheduler = KeywordScheduler(cache)
+        self.pool = CandidatePool(self.partnership_scores)
+        # Streaming discovery: pages of search results from page_source(keyword) flow
+        # through vet_stages into the pool, whose sink streams every new candidate
+        self.page_source = self.search_channel_pages
+        self.vet_stages = [self._known_stage, self._rejection_stage, self._stats_stage,
+                           self._tier_gate, self._videos_stage, self._offer_stage]
+        self.targets = {name: config['target_per_tier'] for name, config in CATEGORIES.items()}
+        # Set in worker mode: claims, tier counts and targets are shared through a SharedStore,
+        # and shared_pool mirrors every worker's candidates to count tiers from
+        self.store = None
+        self.worker_id = None
+        self.shared_pool = None
+        self.export_formats = list(EXPORT_FORMATS)
+        self.export_timings = {}
+        self.tier_counts = {tier: 0 for tier in TIER_CONFIG.keys()}
+        self.category_tier_counts = {}
+        self.skipped_keywords = defaultdict(list)
+        # Keywords whose search still failed after every retry; left out of the checkpoint
+        self.failed_keywords = defaultdict(list)
+        self.completed_keywords = defaultdict(set)
+        self.completed_categories = set()
+        self.sink = None
+        self.checkpoint_path = CHECKPOINT_PATH
+        self.output_file = None
+        # Guards tier_counts and per-category tier counts across workers
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # Set on Ctrl-C so every worker stops at its next stage boundary
+        self._abort = threading.Event()
+        self._checkpoint_lock = threading.Lock()
+        self._merge_lock = threading.Lock()
+    
+    @property
+    def youtube(self):
+        """API client for the current thread using the next key in the pool"""
+        return self.keys.client(self.keys.acquire())
+    
+    def _call(self, endpoint, if_none_match=None, **params):
+        """Execute one API call (e.g. "search.list") through the rate limiter.
+        
+        Every attempt is metered, globally and against the key that made it. Rate-limit,
+        5xx and network errors are retried with exponential backoff and full jitter.
+        A key that runs out of quota is rotated out and the call moves to the next key;
+        QuotaExhaustedError is raised once no key has quota left.
+        
+        With a replay cassette no request leaves the process; the quota meter still
+        records what the call would have cost.
+        
+        With if_none_match (an ETag from an earlier response) the call returns None
+        when the resource has not changed since.
+        """
+        resource, method = endpoint.split('.')
+        category = getattr(self._local, 'category', None)
+        keyword = getattr(self._local, 'keyword', None)
+        attempt = 0
+        start = time.perf_counter()
+        
+        if self.cassette and self.cassette.mode == "replay":
+            response = self.cassette.replay(endpoint, params)
+            units = self.quota.charge(endpoint, category)
+            self._record_call(endpoint, start, response, units, keyword)
+            return response
+        
+        while True:
+            key = self.keys.acquire()
+            self.rate_limiter.acquire()
+            try:
+                if self.async_client:
+                    response = self.async_client.execute(endpoint, key['key'], if_none_match=if_none_match,
+                                                         **params)
+                else:
+                    request = getattr(getattr(self.keys.client(key), resource)(), method)(**params)
+                    if if_none_match:
+                        request.headers['If-None-Match'] = if_none_match
+                    response = request.execute()
+                units = self.quota.charge(endpoint, category)
+                key['meter'].charge(endpoint, category)
+                if self.cassette and response is not None:
+                    self.cassette.record(endpoint, params, response)
+                self._record_call(endpoint, start, response, units, keyword)
+                return response
+            except HttpError as e:
+                units = self.quota.charge(endpoint, category)
+                key['meter'].charge(endpoint, category)
+                if e.resp.status == 304:
+                    # Not modified since if_none_match; googleapiclient raises on any status >= 300
+                    self._record_call(endpoint, start, None, units, keyword)
+                    return None
+                reason = http_error_reason(e)
+                self.metrics.record_error(endpoint, reason)
+                if reason in QUOTA_ERROR_REASONS:
+                    self.keys.mark_exhausted(key)
+                    continue
+                retryable = e.resp.status in RETRYABLE_STATUSES or reason in RETRYABLE_ERROR_REASONS
+                if not retryable or attempt == self.max_retries:
+                    raise
+            except OSError as e:
+                # Connection resets and timeouts from the HTTP transport
+                self.metrics.record_error(endpoint, type(e).__name__)
+                if attempt == self.max_retries:
+                    raise
+            
+            time.sleep(random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt)))
+            attempt += 1
+    
+    def _record_call(self, endpoint, start, response, units, keyword):
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        # Size of the re-serialized body: close to the bytes received for JSON responses
+        nbytes = len(json.dumps(response, separators=(',', ':')))
+        self.metrics.record_call(endpoint, elapsed_ms, nbytes, units, keyword)
+    
+    def _map_io(self, fn, items):
+        """Run fn over items on the I/O pool, keeping quota and metrics attribution to the caller"""
+        category = getattr(self._local, 'category', None)
+        keyword = getattr(self._local, 'keyword', None)
+        
+        def run(item):
+            self._local.category = category
+            self._local.keyword = keyword
+            try:
+                return fn(item)
+            finally:
+                self._local.category = None
+                self._local.keyword = None
+        
+        return list(self._io_pool.map(run, items))
+    
+    def close(self):
+        """Release the I/O pool and any async connection pool"""
+        self._io_pool.shutdown(wait=True)
+        if self.async_client:
+            self.async_client.close()
+    
+    def keyword_cost_estimate(self, max_results, search=True):
+        """Worst-case quota units for searching one keyword and vetting its results.
+        
+        With search=False the results come from the local index and only vetting is counted.
+        """
+        pages = -(-max_results // 50)
+        video_batches = -(-max_results * self.window.video_limit // 50)
+        return (
+            (pages * QUOTA_COSTS["search.list"] if search else 0)
+            + pages * QUOTA_COSTS["channels.list"]
+            + max_results * QUOTA_COSTS["playlistItems.list"]
+            + video_batches * QUOTA_COSTS["videos.list"]
+        )
+    
+    def category_deficits(self, local_counts=None):
+        """Remaining target_per_tier deficit per category"""
+        local_counts = local_counts or {}
+        deficits = {}
+        for category_name, category_config in CATEGORIES.items():
+            counts = local_counts.get(category_name, {})
+            deficits[category_name] = sum(
+                max(0, target - counts.get(tier, 0))
+                for tier, target in category_config['target_per_tier'].items()
+            )
+        return deficits
+    
+    def plan_quota(self, budget, local_counts=None):
+        """Split a quota budget across categories in proportion to their tier deficits"""
+        deficits = self.category_deficits(local_counts)
+        total_deficit = sum(deficits.values())
+        if not total_deficit:
+            return {category_name: 0 for category_name in deficits}
+        return {
+            category_name: budget * deficit // total_deficit
+            for category_name, deficit in deficits.items()
+        }
+    
+    def get_tier_for_subscribers(self, subscriber_count):
+        """Determine which tier a channel belongs to based on subscriber count"""
+        for tier_name, config in TIER_CONFIG.items():
+            if config["min_subs"] <= subscriber_count < config["max_subs"]:
+                return tier_name
+        if subscriber_count >= 500000:
+            return "Macro (500K-1M+ subs)"
+        return None
+    
+    def search_channels(self, query, max_results=50):
+        """Search for channels based on a query"""
+        results = []
+        try:
+            for page in self.search_channel_pages(query, page_size=min(50, max_results)):
+                results.extend(page)
+                if len(results) >= max_results:
+                    break
+        except HttpError as e:
+            print(f"API Error: {e}")
+        return results[:max_results]
+    
+    def search_channel_pages(self, query, page_size=KEYWORD_PAGE_SIZE):
+        """Yield search results for a query one page at a time, so callers can stop paging early.
+        
+        An HttpError left after every retry is raised, so the keyword is not taken as finished.
+        """
+        next_page_token = None
+        page_number = 0
+        
+        while True:
+            cache_key = f"{query}|{page_size}|{page_number}"
+            page = self.cache.get('search', cache_key) if self.cache else None
+            
+            if page is None:
+                response = self._call(
+                    "search.list",
+                    part="snippet",
+                    q=query,
+                    type="channel",
+                    maxResults=page_size,
+                    pageToken=next_page_token,
+                    relevanceLanguage="en",  # Focus on English content
+                    fields=SEARCH_FIELDS
+                )
+                
+                page = {
+                    'items': [
+                        SearchResult(item['snippet']['channelId'], item['snippet']['title']).to_row()
+                        for item in response.get('items', [])
+                    ],
+                    'next_page_token': response.get('nextPageToken')
+                }
+                if self.cache:
+                    self.cache.put('search', cache_key, page)
+                if self.index is not None:
+                    self.index.add_names(dict(page['items']))
+            
+            yield [SearchResult.from_row(row) for row in page['items']]
+            
+            next_page_token = page['next_page_token']
+            page_number += 1
+            if not next_page_token:
+                return
+    
+    def get_channel_stats(self, channel_ids):
+        """Get detailed statistics for a list of channel IDs"""
+        cached = self.cache.get_many('channel', channel_ids) if self.cache else {}
+        stats = {cid: ChannelRecord.from_row(row) for cid, row in cached.items()}
+        missing = [cid for cid in dict.fromkeys(channel_ids) if cid not in stats]
+        
+        for i in range(0, len(missing), 50):
+            batch = missing[i:i+50]
+            try:
+                response = self._call(
+                    "channels.list",
+                    part="statistics,snippet,contentDetails,brandingSettings",
+                    id=','.join(batch),
+                    fields=CHANNEL_FIELDS
+                )
                 
-                channel_stats = stats[channel_id]
-                subs = channel_stats['subscribers']
-                
-                # Determine tier
+                for item in response.get('items', []):
+                    stats[item['id']] = ChannelRecord.from_api(item)
+                    
+            except HttpError as e:
+                print(f"API Error getting stats: {e}")
+        
+        fetched = {cid: stats[cid] for cid in missing if cid in stats}
+        if self.cache:
+            self.cache.put_many('channel', {cid: record.to_row() for cid, record in fetched.items()})
+        if self.index is not None:
+            self.index.add_channels(fetched)
+        
+        return stats
+    
+    def local_pages(self, query, page_size=KEYWORD_PAGE_SIZE):
+        """Yield channels in the local index matching a query, best match first, a page at a time"""
+        matches = self.index.search(query) if self.index is not None else []
+        for i in range(0, len(matches), page_size):
+            yield [SearchResult(channel_id, name) for channel_id, name in matches[i:i+page_size]]
+    
+    def index_cache(self):
+        """Add every channel, search hit and video title in the API cache to the local index"""
+        names = {}
+        for _, page in self.cache.items('search'):
+            names.update(dict(page['items']))
+        self.index.add_names(names)
+        self.index.add_channels({cid: ChannelRecord.from_row(row) for cid, row in self.cache.items('channel')})
+        
+        titles = {vid: VideoRecord.from_row(row).title for vid, row in self.cache.items('video')}
+        channel_titles = {}
+        for key, uploads in self.cache.items('playlist'):
+            uploads_playlist, _, kind = key.partition('|')
+            if kind == 'uploads' and uploads_playlist.startswith('UU'):
+                channel_titles['UC' + uploads_playlist[2:]] = [titles[vid] for vid, _ in uploads if vid in titles]
+        self.index.add_videos(channel_titles)
+        return len(self.index)
+    
+    def analytics_window(self, num_videos=None):
+        """The finder's analytics window, optionally limited to num_videos uploads"""
+        if num_videos is None:
+            return self.window
+        return AnalyticsWindow(num_videos, self.window.max_age_days, self.window.min_age_days)
+    
+    def get_uploads(self, uploads_playlist, fresh=False):
+        """Get [(video_id, published_at)] for a channel's newest UPLOADS_SAMPLED uploads, newest first"""
+        cache_key = f"{uploads_playlist}|uploads"
+        if self.cache and not fresh:
+            uploads = self.cache.get('playlist', cache_key)
+            if uploads is not None:
+                return uploads
+        
+        response = self._call(
+            "playlistItems.list",
+            part="contentDetails",
+            playlistId=uploads_playlist,
+            maxResults=UPLOADS_SAMPLED,
+            fields=PLAYLIST_ITEM_FIELDS
+        )
+        uploads = [
+            [item['contentDetails']['videoId'], item['contentDetails'].get('videoPublishedAt', '')]
+            for item in response.get('items', [])
+        ]
+        
+        if self.cache:
+            self.cache.put('playlist', cache_key, uploads)
+        return uploads
+    
+    def get_recent_video_ids(self, uploads_playlist, num_videos=None, fresh=False):
+        """Get the IDs of a channel's uploads in the analytics window (at most num_videos if given)"""
+        return self.analytics_window(num_videos).select(self.get_uploads(uploads_playlist, fresh), datetime.now(timezone.utc))
+    
+    def get_videos_stats(self, video_ids, fresh=False, failed=None):
+        """Get statistics for a list of video IDs in batches of 50.
+        
+        IDs in batches that failed with an API error are added to the failed set, if given.
+        """
+        cached = self.cache.get_many('video', video_ids) if self.cache and not fresh else {}
+        videos = {vid: VideoRecord.from_row(row) for vid, row in cached.items()}
+        missing = [vid for vid in dict.fromkeys(video_ids) if vid not in videos]
+        
+        for i in range(0, len(missing), 50):
+            batch = missing[i:i+50]
+            try:
+                response = self._call(
+                    "videos.list",
+                    part="statistics,snippet",
+                    id=','.join(batch),
+                    fields=VIDEO_FIELDS
+                )
+                
+                for item in response.get('items', []):
+                    videos[item['id']] = VideoRecord.from_api(item)
+                    
+            except HttpError as e:
+                print(f"API Error getting video stats: {e}")
+                if failed is not None:
+                    failed.update(batch)
+        
+        if self.cache:
+            self.cache.put_many('video', {vid: videos[vid].to_row() for vid in missing if vid in videos})
+        
+        return videos
+    
+    def get_recent_videos_stats_batch(self, channel_stats, num_videos=None, fresh=False):
+        """Get recent video stats and analytics for many channels at once.
+        
+        Reuses the uploads playlist already returned by get_channel_stats, picks each
+        channel's videos in the analytics window from its playlist items' publish
+        dates, and resolves only those in shared 50-ID videos().list batches.
+        With fresh=True cached playlists and video stats are ignored. A channel whose
+        playlist or video stats failed to load is flagged with 'error'.
+        """
+        window = self.analytics_window(num_videos)
+        now = datetime.now(timezone.utc)
+        
+        def uploads(stats):
+            if not stats.uploads_playlist:
+                return []
+            try:
+                return self.get_uploads(stats.uploads_playlist, fresh)
+            except HttpError as e:
+                return None
+        
+        # One playlistItems().list call per channel, issued in parallel
+        channel_uploads = dict(zip(channel_stats.keys(), self._map_io(uploads, channel_stats.values())))
+        failed = {channel_id for channel_id, items in channel_uploads.items() if items is None}
+        channel_video_ids = {
+            channel_id: window.select(items or [], now) for channel_id, items in channel_uploads.items()
+        }
+        
+        all_video_ids = [vid for video_ids in channel_video_ids.values() for vid in video_ids]
+        failed_videos = set()
+        videos = self.get_videos_stats(all_video_ids, fresh, failed_videos)
+        
+        results = {}
+        for channel_id, video_ids in channel_video_ids.items():
+            videos_data = [videos[vid] for vid in video_ids if vid in videos]
+            views = [v.views for v in videos_data]
+            results[channel_id] = {
+                'avg_views': int(sum(views) / len(views)) if views else 0,
+                'recent_videos': videos_data,
+                'analytics': window.summarize(channel_uploads[channel_id] or [], videos_data, now),
+                'error': channel_id in failed or any(vid in failed_videos for vid in video_ids)
+            }
+        
+        if self.index is not None:
+            self.index.add_videos({
+                channel_id: [v.title for v in result['recent_videos']] for channel_id, result in results.items()
+            })
+        return results
+    
+    def get_recent_videos_stats(self, channel_id, num_videos=None, uploads_playlist=None):
+        """Get statistics from recent videos including avg views"""
+        if not uploads_playlist and channel_id.startswith('UC'):
+            # A channel's uploads playlist ID is its channel ID with UU in place of UC
+            uploads_playlist = 'UU' + channel_id[2:]
+        if not uploads_playlist:
+            try:
+                # Get uploads playlist
+                response = self._call(
+                    "channels.list",
+                    part="contentDetails",
+                    id=channel_id,
+                    fields=UPLOADS_PLAYLIST_FIELDS
+                )
+            except HttpError as e:
+                return {'avg_views': 0, 'recent_videos': []}
+            
+            if not response.get('items'):
+                return {'avg_views': 0, 'recent_videos': []}
+            
+            uploads_playlist = response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
+        
+        results = self.get_recent_videos_stats_batch(
+            {channel_id: ChannelRecord(channel_id, uploads_playlist=uploads_playlist)}, num_videos
+        )
+        return results[channel_id]
+    
+    def _score_inputs(self, df):
+        """Vectorized engagement ratios, partnership signals and composite score for a frame of creators.
+        
+        Rows streamed before the recent-video analytics were recorded score on
+        engagement and business contact only.
+        """
+        def column(name, default=0):
+            return (df[name].fillna(default) if name in df.columns else pd.Series(default, index=df.index)).to_numpy(float)
+        
+        subs = column('Subscribers (Raw)')
+        avg_views = column('Avg Views (Raw)')
+        recent_views = column('Recent Views')
+        recent_videos = column('Recent Videos')
+        with np.errstate(divide='ignore', invalid='ignore'):
+            engagement = np.where(subs > 0, avg_views / subs, 0.0)
+            like_rate = np.where(recent_views > 0, column('Recent Likes') / recent_views, 0.0)
+            comment_rate = np.where(recent_views > 0, column('Recent Comments') / recent_views, 0.0)
+            cadence = column('Uploads per Week')
+            consistency = np.where(avg_views > 0, column('Median Views (Raw)') / avg_views, 0.0)
+        descriptions = df['Description'].fillna('').astype(str) if 'Description' in df.columns else pd.Series('', index=df.index)
+        business = descriptions.str.contains('|'.join(BUSINESS_CONTACT_WORDS), case=False, regex=True).to_numpy()
+        
+        signals = {
+            'engagement': engagement, 'like_rate': like_rate, 'comment_rate': comment_rate,
+            'upload_cadence': cadence, 'consistency': consistency, 'business_contact': business.astype(float)
+        }
+        score = sum(weight * np.clip(signals[name] / saturation, 0, 1)
+                    for name, (weight, saturation) in PARTNERSHIP_SCORE.items())
+        return {
+            'engagement': engagement, 'like_rate': like_rate, 'comment_rate': comment_rate,
+            'cadence': cadence, 'business': business, 'recent_videos': recent_videos,
+            'score': np.round(score * 100, 1)
+        }
+    
+    def partnership_scores(self, creators):
+        """Composite partnership score (0-100) for each creator row, computed over arrays"""
+        if not creators:
+            return np.array([])
+        return self._score_inputs(pd.DataFrame.from_records(creators))['score']
+    
+    def score_creators(self, creators):
+        """Scoring stage over the full set of chosen creators, as one DataFrame.
+        
+        Tiers and view ranges are binned with np.digitize, engagement ratios, upload
+        cadence and partnership signals are computed over columns, and the 'Why this
+        Creator' text is built column-wise. A channel whose subscribers left every
+        tier keeps its last tier.
+        """
+        df = pd.DataFrame.from_records(creators)
+        if not len(df):
+            return df
+        inputs = self._score_inputs(df)
+        subs = df['Subscribers (Raw)'].fillna(0).to_numpy(float)
+        avg_views = df['Avg Views (Raw)'].fillna(0).to_numpy(float)
+        
+        tiers = sorted(TIER_CONFIG, key=lambda name: TIER_CONFIG[name]['min_subs'])
+        tier_index = np.digitize(subs, [TIER_CONFIG[name]['min_subs'] for name in tiers])
+        tier = np.array([None] + tiers, dtype=object)[tier_index]
+        if 'Subscriber Category' in df.columns:
+            tier = np.where(tier_index > 0, tier, df['Subscriber Category'].to_numpy(object))
+        df['Subscriber Category'] = tier
+        
+        df['Subscribers'] = np.select(
+            [subs >= 1000000, subs >= 1000],
+            [np.char.mod('%.2fM', subs / 1000000), np.char.mod('%.1fK', subs / 1000)],
+            np.char.mod('%d', subs)
+        )
+        df['Avg Views'] = np.array(VIEW_RANGE_LABELS)[np.digitize(avg_views, VIEW_RANGE_EDGES)]
+        
+        engagement = inputs['engagement']
+        df['Engagement Rate'] = np.round(engagement * 100, 2)
+        df['Like Rate'] = np.round(inputs['like_rate'] * 100, 2)
+        df['Comment Rate'] = np.round(inputs['comment_rate'] * 100, 3)
+        df['Uploads per Week'] = np.round(inputs['cadence'], 2)
+        
+        recent_videos = inputs['recent_videos'].astype(int)
+        signals = [
+            np.where(inputs['business'], "Has business contact info", ""),
+            np.where(recent_videos > 0, np.char.add(np.char.add("Active channel (", recent_videos.astype(str)), " recent videos)"), ""),
+            np.select([engagement * 100 > 10, engagement * 100 > 5], ["High engagement (>10%)", "Good engagement (>5%)"], "")
+        ]
+        df['Partnership Signals'] = ["; ".join(filter(None, row)) for row in zip(*signals)]
+        df['Partnership Score'] = inputs['score']
+        
+        engagement_rate = engagement * 100
+        engagement_desc = np.select(
+            [engagement_rate > 10, engagement_rate > 5, engagement_rate > 2],
+            ["Very high engagement rate", "Strong engagement rate", "Good engagement rate"],
+            "Growing channel"
+        )
+        categories = df['Content Category']
+        prefix = categories.map(lambda name: CATEGORY_REASONS.get(name, ("Active creator.", ""))[0])
+        suffix = categories.map(lambda name: CATEGORY_REASONS.get(name, ("", ""))[1])
+        df['Why this Creator'] = (
+            prefix + " " + engagement_desc + "." + np.where(suffix != "", " " + suffix, "")
+            + " " + df['Subscriber Category'].map(lambda name: TIER_NOTES.get(name, ''))
+        )
+        return df
+    
+    def _targets_met(self, tier_counts_local, target_per_tier):
+        """Check if every tier target for a category has been met"""
+        return all(
+            tier_counts_local[tier] >= target_per_tier.get(tier, 0)
+            for tier in TIER_CONFIG.keys()
+        )
+    
+    def _process_keyword(self, keyword, category_name, target_per_tier, tier_counts_local, stop_event,
+                         local=False):
+        """Search one keyword and add its qualifying channels to the candidate pool.
+        
+        With local=True only the local channel index is searched. Returns True if
+        the keyword was fully processed.
+        """
+        if self._stopping(stop_event):
+            return False
+        
+        self._local.category = category_name
+        self._local.keyword = keyword
+        self.metrics.keyword_yield(category_name, keyword)
+        try:
+            complete = self._page_keyword(keyword, category_name, target_per_tier,
+                                          tier_counts_local, stop_event, local)
+            return complete and not self._abort.is_set()
+        except CassetteMissError:
+            # Replaying with settings that need requests the recorded session never made
+            return False
+        except HttpError as e:
+            print(f"\n⚠️  API Error on '{keyword}', keyword left for --resume: {e}")
+            with self._lock:
+                self.failed_keywords[category_name].append(keyword)
+            return False
+        except QuotaExhaustedError as e:
+            with self._lock:
+                if not self.quota_exhausted:
+                    print(f"\n🛑 API quota exhausted ({e}), stopping the run")
+                self.quota_exhausted = True
+            self._abort.set()
+            return False
+        finally:
+            self._local.category = None
+            self._local.keyword = None
+    
+    def _page_keyword(self, keyword, category_name, target_per_tier, tier_counts_local, stop_event,
+                      local=False):
+        """Pull a keyword's pages through the vetting pipeline one at a time.
+        
+        Paging stops at the last page, once a page's yield per quota unit drops below
+        KEYWORD_MIN_YIELD, or as soon as every tier target is met. Returns False if the
+        quota budget ran out before the keyword was finished. Local index pages are
+        all vetted (they cost no search call) and not recorded for the scheduler.
+        """
+        # Reserve each page's worst-case cost up front so the run stops before the budget runs out
+        reserved = self.keyword_cost_estimate(KEYWORD_PAGE_SIZE, search=not local)
+        task = KeywordTask(keyword, category_name, target_per_tier, tier_counts_local, stop_event)
+        pages = 0
+        
+        with contextlib.closing(self.vetting_pipeline(task, local)) as pipeline:
+            while local or pages < KEYWORD_MAX_PAGES:
+                pages += 1
+                if self._stopping(stop_event):
+                    break
+                if not self.quota.try_reserve(category_name, reserved):
+                    if not local:
+                        self.skipped_keywords[category_name].append(keyword)
+                    return False
+                
+                units_before = self.metrics.keyword_units(keyword)
+                try:
+                    batch = next(pipeline, None)
+                finally:
+                    self.quota.release(category_name, reserved)
+                if batch is None:
+                    break
+                
+                added = batch.added
+                if added:
+                    self._sync_tier_counts()
+                    if self._targets_met(tier_counts_local, target_per_tier):
+                        stop_event.set()
+                if local:
+                    continue
+                units = self.metrics.keyword_units(keyword) - units_before
+                self.scheduler.record_page(category_name, keyword, units, added)
+                # Channels already vetted (e.g. from the local index) still show the keyword
+                # finds qualified creators, so they count towards the page's yield here
+                if units and (sum(added.values()) + batch.known) / units < KEYWORD_MIN_YIELD:
+                    break
+        
+        return True
+    
+    def vetting_pipeline(self, task, local=False):
+        """Compose the streaming stages for one keyword: page source, then each of vet_stages.
+        
+        The source is page_source, or local_pages with local=True. Every stage is a
+        generator that takes batches and yields exactly one batch per page, so pulling
+        one batch from the end pulls one page of search results through every stage,
+        and no page is fetched before the one ahead of it is in the pool.
+        """
+        source = self.local_pages if local else self.page_source
+        pages = self._timed('local_search' if local else 'search', source(task.keyword))
+        batches = (VetBatch(page) for page in pages)
+        for stage in self.vet_stages:
+            batches = stage(task, batches)
+        return batches
+    
+    def _timed(self, stage, iterator):
+        """Yield from iterator, timing each step as an Instrumentation stage"""
+        while True:
+            with self.metrics.stage(stage):
+                item = next(iterator, None)
+            if item is None:
+                return
+            yield item
+    
+    def _tally(self, task, **counts):
+        self.metrics.keyword_yield(task.category, task.keyword, **counts)
+    
+    def _offer(self, task, batch, creator_data):
+        """Add a qualified channel to the pool (and through it the sink) as an option for task's category"""
+        if self.pool.add(creator_data):
+            batch.added[creator_data['Subscriber Category']] += 1
+            self._tally(task, accepted=1)
+        else:
+            self._tally(task, already_seen=1)
+    
+    def _known_stage(self, task, batches):
+        """Channels another keyword already qualified just gain this category as an option"""
+        for batch in batches:
+            self._tally(task, candidates=len(batch.channels))
+            channels = []
+            for channel in batch.channels:
+                creator_data = self.pool.option(channel.channel_id, task.category)
+                if creator_data is not None:
+                    self._offer(task, batch, creator_data)
+                else:
+                    channels.append(channel)
+            batch.known = batch.found - len(channels)
+            batch.channels = channels
+            yield batch
+    
+    def _rejection_stage(self, task, batches):
+        """Drop channels rejected for reasons that still hold, and in worker mode those another worker claimed"""
+        for batch in batches:
+            channels = batch.channels
+            if channels and not self._stopping(task.stop_event):
+                self.rejections.prefetch([c.channel_id for c in channels])
+                unrejected = [
+                    c for c in channels
+                    if not self.rejections.skip_reason(c.channel_id, task.tier_counts, task.target_per_tier)
+                ]
+                self._tally(task, previously_rejected=len(channels) - len(unrejected))
+                channels = unrejected
+                
+                # In worker mode, leave channels another worker is vetting to that worker
+                if self.store and channels:
+                    mine = self.store.claim([c.channel_id for c in channels], self.worker_id, task.category)
+                    self._tally(task, already_seen=len(channels) - len(mine))
+                    channels = [c for c in channels if c.channel_id in mine]
+                batch.channels = channels
+            else:
+                batch.channels = []
+            yield batch
+    
+    def _stats_stage(self, task, batches):
+        """Fetch each page's channel stats in one batched call, at most once per channel per run"""
+        for batch in batches:
+            if batch.channels:
+                missing = [c.channel_id for c in batch.channels if c.channel_id not in self.pool.stats]
+                with self.metrics.stage('stats'):
+                    fetched = self.get_channel_stats(missing)
+                batch.stats = {c.channel_id: self.pool.stats.get(c.channel_id) or fetched.get(c.channel_id)
+                               for c in batch.channels}
+                batch.channels = [c for c in batch.channels if batch.stats[c.channel_id] is not None]
+            yield batch
+    
+    def _tier_gate(self, task, batches):
+        """Keep only channels that could still fill a tier for this category"""
+        for batch in batches:
+            channels = []
+            tier_full = []
+            for channel in batch.channels:
+                channel_id = channel.channel_id
+                subs = batch.stats[channel_id].subscribers
                 tier = self.get_tier_for_subscribers(subs)
                 if tier is None:
+                    self.rejections.record(channel_id, 'out_of_tier', subscribers=subs)
+                    self._tally(task, out_of_tier=1)
                     continue
                 
                 # Check if we need more creators in this tier for this category
-                if tier_counts_local[tier] >= target_per_tier.get(tier, 0):
+                if task.tier_counts[tier] >= task.target_per_tier.get(tier, 0):
+                    self.rejections.record(channel_id, 'tier_full', subscribers=subs, tier=tier)
+                    self.pool.stats[channel_id] = batch.stats[channel_id]
+                    tier_full.append(channel_id)
+                    self._tally(task, tier_full=1)
                     continue
                 
-                # Get recent videos and avg views
-                video_data = self.get_recent_videos_stats(channel_id)
+                channels.append(channel)
+            
+            if self.store and tier_full:
+                # Another category may still need these channels' tiers
+                self.store.release(tier_full)
+            batch.channels = channels
+            yield batch
+    
+    def _videos_stage(self, task, batches):
+        """Get recent videos and avg views for a page's candidates in shared batches"""
+        for batch in batches:
+            if batch.channels and not self._stopping(task.stop_event):
+                with self.metrics.stage('recent_videos'):
+                    batch.videos = self.get_recent_videos_stats_batch(
+                        {c.channel_id: batch.stats[c.channel_id] for c in batch.channels}
+                    )
+            else:
+                batch.channels = []
+            yield batch
+    
+    def _offer_stage(self, task, batches):
+        """Reject channels with no uploads in the window or low views, and offer the rest to the pool"""
+        for batch in batches:
+            for channel in batch.channels:
+                channel_id = channel.channel_id
+                channel_stats = batch.stats[channel_id]
+                video_data = batch.videos[channel_id]
                 avg_views = video_data['avg_views']
                 
+                # A failed fetch says nothing about the channel: leave it for a later page or run
+                if video_data['error']:
+                    if self.store:
+                        self.store.release([channel_id])
+                    continue
+                
+                # Nothing in the window says nothing about views; a wider window may find uploads
+                if not video_data['analytics']['Recent Videos']:
+                    self.rejections.record(channel_id, 'no_recent_uploads', subscribers=channel_stats.subscribers,
+                                           tier=self.get_tier_for_subscribers(channel_stats.subscribers))
+                    self._tally(task, no_recent_uploads=1)
+                    continue
+                
                 # Skip channels with very low engagement
                 if avg_views < 100:
+                    self.rejections.record(channel_id, 'low_views', subscribers=channel_stats.subscribers,
+                                           avg_views=avg_views,
+                                           tier=self.get_tier_for_subscribers(channel_stats.subscribers))
+                    self._tally(task, low_views=1)
                     continue
                 
-                self.seen_channel_ids.add(channel_id)
+                self._offer(task, batch, self._creator_data(channel, channel_stats, video_data, task.category))
+            yield batch
+    
+    def _creator_data(self, channel, channel_stats, video_data, category_name):
+        """Build a channel's output row for one category.
+        
+        Only raw numbers are recorded here; the formatted columns, ratios, partnership
+        score and 'Why this Creator' text are filled by score_creators() once the
+        creators are chosen.
+        """
+        subs = channel_stats.subscribers
+        avg_views = video_data['avg_views']
+        creator_data = {
+            'Channel ID': channel.channel_id,
+            'Channel name': channel.channel_name,
+            'Link': channel_stats.channel_url,
+            'Subscribers': None,
+            'Subscribers (Raw)': subs,
+            'Avg Views': None,
+            'Avg Views (Raw)': avg_views,
+            'Content Category': category_name,
+            'Subscriber Category': self.get_tier_for_subscribers(subs),
+            'Why this Creator': '',  # Will be filled later
+            'Country': channel_stats.country,
+            'Video Count': channel_stats.video_count,
+            'Description': channel_stats.description[:200]
+        }
+        creator_data.update(video_data['analytics'])
+        return creator_data
+    
+    def _sync_tier_counts(self):
+        """Refresh per-category and overall tier counts from the pool's current assignment.
+        
+        In worker mode the assignment is over every worker's candidates in the shared store.
+        """
+        if self.store:
+            self.targets = self.store.targets()
+            with self._merge_lock:
+                self.merge_store(self.store, self.shared_pool)
+            assigned = self.shared_pool.assign(self.targets)
+        else:
+            assigned = self.pool.assign(self.targets)
+        totals = {tier: 0 for tier in TIER_CONFIG.keys()}
+        with self._lock:
+            for category_name, creators in assigned.items():
+                counts = {tier: 0 for tier in TIER_CONFIG.keys()}
+                for creator in creators:
+                    counts[creator['Subscriber Category']] += 1
+                for tier, count in counts.items():
+                    totals[tier] += count
+                # Update in place: keyword workers hold references to these dicts
+                self.category_tier_counts.setdefault(category_name, {}).update(counts)
+            self.tier_counts = totals
+    
+    def _stopping(self, stop_event):
+        """Check if a keyword worker should stop at this stage boundary"""
+        return stop_event.is_set() or self._abort.is_set()
+    
+    def find_creators_for_category(self, category_name, category_config):
+        """Search a category's keywords into the shared candidate pool.
+        
+        Keywords are processed concurrently on a pool of max_workers threads, in
+        the order the KeywordScheduler expects to fill the remaining tiers fastest.
+        Once the pool's current assignment meets every tier target, no further
+        keywords are started and in-flight ones stop at their next stage boundary.
+        Keywords already completed by a resumed run are skipped.
+        
+        Returns the creators currently assigned to the category.
+        """
+        if category_name in self.completed_categories:
+            print(f"\n⏭️  Skipping completed category: {category_name}")
+            return self.pool.assign(self.targets)[category_name]
+        
+        print(f"\n🔍 Searching category: {category_name}")
+        print(f"   Target per tier: {category_config['target_per_tier']}")
+        
+        self._sync_tier_counts()
+        tier_counts_local = self.category_tier_counts[category_name]
+        completed_keywords = self.completed_keywords[category_name]
+        keywords = [k for k in category_config['keywords'] if k not in completed_keywords]
+        target_per_tier = category_config['target_per_tier']
+        stop_event = threading.Event()
+        if self._targets_met(tier_counts_local, target_per_tier):
+            stop_event.set()
+        
+        if self.index is not None and not self._stopping(stop_event):
+            self.search_locally(category_name, category_config['keywords'], stop_event)
+        
+        self.scheduler.load(category_name, keywords)
+        
+        from tqdm import tqdm
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor, \
+                tqdm(total=len(keywords), desc="Keywords") as progress:
+            running = {}
+            
+            def submit_next():
+                # Pick keywords one at a time so each choice sees the latest tier counts
+                while keywords and len(running) < self.max_workers and not self._stopping(stop_event):
+                    with self._lock:
+                        keyword = self.scheduler.next_keyword(
+                            category_name, keywords, tier_counts_local, target_per_tier
+                        )
+                    keywords.remove(keyword)
+                    running[executor.submit(
+                        self._process_keyword, keyword, category_name, target_per_tier,
+                        tier_counts_local, stop_event
+                    )] = keyword
+            
+            try:
+                submit_next()
+                while running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        keyword = running.pop(future)
+                        progress.update()
+                        if future.result():
+                            with self._lock:
+                                completed_keywords.add(keyword)
+                            self.save_checkpoint()
+                    # Keywords are no longer submitted once every tier target is met
+                    submit_next()
+            except BaseException:
+                stop_event.set()
+                raise
+        
+        self._sync_tier_counts()
+        with self._lock:
+            finished = stop_event.is_set() or (
+                not self._abort.is_set() and not self.skipped_keywords[category_name]
+                and not self.failed_keywords[category_name]
+            )
+            if finished:
+                self.completed_categories.add(category_name)
+            remaining = {
+                name: deficit
+                for name, deficit in self.category_deficits(self.category_tier_counts).items()
+                if name not in self.completed_categories
+            }
+        self.quota.reallocate(category_name, remaining)
+        self.save_checkpoint()
+        
+        category_creators = self.pool.assign(self.targets)[category_name]
+        print(f"✅ {len(category_creators)} creators currently assigned to {category_name}")
+        print(f"   Breakdown: {tier_counts_local}")
+        print(f"   Quota: {self.quota.units_by_category[category_name]} units")
+        if self.skipped_keywords[category_name]:
+            print(f"   ⚠️  Skipped {len(self.skipped_keywords[category_name])} keywords to stay within the quota budget")
+        if self.failed_keywords[category_name]:
+            print(f"   ⚠️  {len(self.failed_keywords[category_name])} keywords failed with API errors")
+        
+        return category_creators
+    
+    def search_locally(self, category_name, keywords, stop_event):
+        """Vet a category's keyword matches from the local channel index, before any live search"""
+        target_per_tier = self.targets[category_name]
+        tier_counts_local = self.category_tier_counts[category_name]
+        filled = sum(tier_counts_local.values())
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(
+                lambda keyword: self._process_keyword(keyword, category_name, target_per_tier,
+                                                      tier_counts_local, stop_event, local=True),
+                keywords
+            ))
+        self._sync_tier_counts()
+        print(f"   📚 Local index: {sum(tier_counts_local.values()) - filled} tier slots filled without searching")
+    
+    def search_categories(self, category_names):
+        """Search several categories into the candidate pool on the category pool"""
+        with ThreadPoolExecutor(max_workers=self.category_workers) as executor:
+            futures = [
+                executor.submit(self.find_creators_for_category, category_name, CATEGORIES[category_name])
+                for category_name in category_names
+            ]
+            try:
+                # Report in category order
+                for future in futures:
+                    future.result()
+                    print(f"\n📊 Candidate pool: {len(self.pool)} channels")
+                    print(f"   Tier Distribution: {self.tier_counts}")
+            except BaseException:
+                self._abort.set()
+                for pending in futures:
+                    pending.cancel()
+                raise
+    
+    def reopen_short_categories(self):
+        """Reopen finished categories the latest assignment left short, if they have keywords left.
+        
+        A category can stop early and later lose channels to another category that
+        had fewer alternatives; it then searches its remaining keywords in another round.
+        """
+        self._sync_tier_counts()
+        reopened = []
+        with self._lock:
+            for category_name, category_config in CATEGORIES.items():
+                if category_name not in self.completed_categories:
+                    continue
+                if self._targets_met(self.category_tier_counts[category_name], category_config['target_per_tier']):
+                    continue
+                if set(category_config['keywords']) - self.completed_keywords[category_name]:
+                    self.completed_categories.discard(category_name)
+                    reopened.append(category_name)
+        return reopened
+    
+    def assign_creators(self, stream_file):
+        """Fill every category from the candidate pool, score the chosen creators and stream them"""
+        self._sync_tier_counts()
+        assignment = self.pool.assign(self.targets)
+        creators = [creator for category_name in CATEGORIES.keys() for creator in assignment[category_name]]
+        with self.metrics.stage('scoring'):
+            df = self.score_creators(creators)
+        self.sink = CreatorSink(stream_file)
+        for creator in df.to_dict('records'):
+            self.sink.write(creator)
+        self.sink.close()
+    
+    def work(self, store, worker_id):
+        """Process work units from a shared store until the coordinator finishes the run.
+        
+        max_workers threads each take one (category, keyword) unit at a time. Tier
+        counts and targets come from the store, and qualified candidates go to it.
+        """
+        self.store = store
+        self.worker_id = worker_id
+        self.pool.sink = store
+        self.shared_pool = CandidatePool(self.partnership_scores)
+        print(f"👷 Worker {worker_id} on {store.path}")
+        
+        def work_loop():
+            while not self._abort.is_set():
+                unit = store.next_unit(worker_id)
+                if unit is None:
+                    if store.finished():
+                        return
+                    time.sleep(WORKER_POLL_INTERVAL)
+                    continue
                 
-                creator_data = {
-                    'Channel name': channel['channel_name'],
-                    'Link': channel_stats['channel_url'],
-                    'Subscribers': self.format_subscriber_count(subs),
-                    'Subscribers (Raw)': subs,
-                    'Avg Views': self.format_view_range(avg_views),
-                    'Avg Views (Raw)': avg_views,
-                    'Content Category': category_name,
-                    'Subscriber Category': tier,
-                    'Why this Creator': '',  # Will be filled later
-                    'Country': channel_stats['country'],
-                    'Video Count': channel_stats['video_count'],
-                    'Description': channel_stats['description'][:200]
-                }
+                category_name, keyword = unit
+                self._sync_tier_counts()
+                target_per_tier = self.targets[category_name]
+                tier_counts_local = self.category_tier_counts[category_name]
+                if self._targets_met(tier_counts_local, target_per_tier):
+                    store.finish_unit(category_name, keyword, 'skipped')
+                    continue
                 
-                # Generate why reason
-                creator_data['Why this Creator'] = self.generate_why_reason(
-                    creator_data, category_name, video_data['recent_videos']
+                stop_event = threading.Event()
+                tier_full_before = self.metrics.keyword_outcome(keyword, 'tier_full')
+                if self.index is not None:
+                    self._process_keyword(keyword, category_name, target_per_tier,
+                                          tier_counts_local, stop_event, local=True)
+                # Targets met from the local index leave nothing to search for
+                complete = stop_event.is_set() or self._process_keyword(
+                    keyword, category_name, target_per_tier, tier_counts_local, stop_event
                 )
+                # An unfinished unit (quota ran out) goes back to the queue for another worker;
+                # one cut short by full tiers can be requeued if the merged assignment frees them
+                limited = stop_event.is_set() or self.metrics.keyword_outcome(keyword, 'tier_full') > tier_full_before
+                failed = keyword in self.failed_keywords[category_name]
+                status = ('failed' if failed else 'pending' if not complete
+                          else 'limited' if limited else 'done')
+                store.finish_unit(category_name, keyword, status)
+                print(f"   {'✅' if complete else '⏸️ '} {category_name}: {keyword}")
+                if not complete and not failed:
+                    self._abort.set()
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(work_loop) for _ in range(self.max_workers)]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                self._abort.set()
+                raise
+        print(f"👷 Worker {worker_id} done, quota used: {self.quota.total_units} units")
+    
+    def merge_store(self, store, pool=None):
+        """Add every worker's candidates in a shared store to pool, by default a rebuilt self.pool.
+        
+        Options already in the pool are left alone, so a pool can be brought up to date repeatedly.
+        """
+        if pool is None:
+            pool = self.pool = CandidatePool(self.partnership_scores)
+        for creator in store.candidates():
+            entry = pool.entries.get(creator['Channel ID'])
+            if entry is None or creator['Content Category'] not in entry['rows']:
+                pool.add(creator)
+        # Channels vetted under one category are options for every category that surfaced them
+        for channel_id, category_name in store.hits():
+            entry = pool.entries.get(channel_id)
+            if entry is None or category_name in entry['rows'] or category_name not in CATEGORIES:
+                continue
+            pool.add(pool.option(channel_id, category_name))
+    
+    def coordinate(self, store, output_file, processes=0, key_count=1):
+        """Run a distributed search through a shared store and merge it into the normal outputs.
+        
+        Every category's keywords are queued (best expected yield first, categories
+        interleaved) for worker processes: `processes` local ones started here with
+        API keys assigned round-robin, plus any started elsewhere with the worker command.
+        Categories the merged assignment leaves short get their skipped keywords
+        requeued, for up to ASSIGNMENT_ROUNDS rounds.
+        """
+        all_tiers = list(TIER_CONFIG.keys())
+        per_category = []
+        for category_name, category_config in CATEGORIES.items():
+            self.scheduler.load(category_name, category_config['keywords'])
+            per_category.append(sorted(
+                category_config['keywords'],
+                key=lambda k: -self.scheduler.expected_yield(category_name, k, all_tiers)
+            ))
+        units = [
+            (category_name, keyword)
+            for keywords in zip_longest(*per_category)
+            for category_name, keyword in zip(CATEGORIES.keys(), keywords)
+            if keyword is not None
+        ]
+        store.setup(units, self.targets)
+        print(f"🧭 Coordinating {len(units)} keyword units on {store.path}")
+        
+        workers = [
+            subprocess.Popen([sys.executable, os.path.abspath(__file__), 'worker', store.path,
+                              '--key-index', str(i % max(1, key_count)),
+                              '--window-videos', str(self.window.max_videos or 0),
+                              '--window-days', str(self.window.max_age_days or 0)])
+            for i in range(processes)
+        ]
+        try:
+            for _ in range(ASSIGNMENT_ROUNDS):
+                while True:
+                    progress = store.progress()
+                    if not progress.get('pending') and not progress.get('claimed'):
+                        break
+                    if workers and all(w.poll() is not None for w in workers):
+                        print("\n⚠️  Every worker process exited with work left in the queue")
+                        break
+                    print(f"   Queue: {progress}", flush=True)
+                    time.sleep(COORDINATOR_POLL_INTERVAL)
                 
-                category_creators.append(creator_data)
-                tier_counts_local[tier] += 1
-                self.tier_counts[tier] += 1
-                
-                time.sleep(0.3)  # Rate limiting
+                self.merge_store(store)
+                self._sync_tier_counts()
+                reopened = 0
+                for category_name, target_per_tier in self.targets.items():
+                    if not self._targets_met(self.category_tier_counts[category_name], target_per_tier):
+                        reopened += store.reopen(category_name)
+                if not reopened:
+                    break
+                print(f"\n🔁 Assignment left categories short, requeued {reopened} keyword units")
+        finally:
+            store.set_finished()
+            for worker in workers:
+                worker.wait()
         
-        print(f"✅ Found {len(category_creators)} creators in {category_name}")
-        print(f"   Breakdown: {tier_counts_local}")
+        stream_file = output_file.replace('.csv', '.jsonl')
+        self.assign_creators(stream_file)
+        df, paths = self.export(self.sink.read(), output_file)
         
-        return category_creators
+        print("\n" + "=" * 70)
+        print("✅ COMPLETE!")
+        print("=" * 70)
+        self.print_output_files(paths, ("Stream (JSONL)", stream_file))
+        print(f"\n📊 Total creators found: {len(df)} (from a pool of {len(self.pool)} candidates)")
+        if len(df):
+            print("\n📈 Breakdown by Category:")
+            print(df['Content Category'].value_counts().to_string())
+            print("\n📈 Breakdown by Tier:")
+            print(df['Subscriber Category'].value_counts().to_string())
+        return df
+    
+    def save_checkpoint(self):
+        """Atomically write run progress so an interrupted run can be resumed"""
+        if not self.checkpoint_path or not self.output_file:
+            return
+        
+        with self._lock:
+            state = {
+                'output_file': self.output_file,
+                'completed_keywords': {k: sorted(v) for k, v in self.completed_keywords.items()},
+                'completed_categories': sorted(self.completed_categories),
+                'updated_at': datetime.now().isoformat(timespec='seconds')
+            }
+        
+        with self._checkpoint_lock:
+            tmp_path = self.checkpoint_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.checkpoint_path)
+    
+    @staticmethod
+    def load_checkpoint(checkpoint_path=CHECKPOINT_PATH):
+        """Read a checkpoint file, or None if there is none"""
+        if not os.path.exists(checkpoint_path):
+            return None
+        with open(checkpoint_path, encoding='utf-8') as f:
+            return json.load(f)
+    
+    def restore_checkpoint(self, state):
+        """Restore run progress from a checkpoint and the candidates already streamed"""
+        self.output_file = state['output_file']
+        self.completed_categories = set(state['completed_categories'])
+        self.completed_keywords = defaultdict(set, {
+            k: set(v) for k, v in state['completed_keywords'].items()
+        })
+        
+        # The streamed candidates are the source of truth for the pool and so for the
+        # tier counts: they may hold candidates found after the last checkpoint was written
+        candidates_path = self.output_file.replace('.csv', '_candidates.jsonl')
+        if os.path.exists(candidates_path):
+            for creator in CreatorSink.read_file(candidates_path):
+                self.pool.add(creator)
+        self._sync_tier_counts()
     
-    def run(self, output_file="higgsfield_creators.csv"):
-        """Main execution method"""
+    def run(self, output_file="higgsfield_creators.csv", resume=False):
+        """Main execution method.
+        
+        Accepted creators are streamed to <output>.jsonl as they are found, and
+        progress is checkpointed after every keyword. With resume=True the run
+        continues from the last checkpoint, keeping its output files.
+        """
+        if resume:
+            state = self.load_checkpoint(self.checkpoint_path)
+            if state is None:
+                print(f"⚠️  No checkpoint found at {self.checkpoint_path}, starting a new run")
+            else:
+                self.restore_checkpoint(state)
+                output_file = self.output_file
+                print(f"♻️  Resuming run from {state['updated_at']} ({output_file})")
+        self.output_file = output_file
+        
         print("=" * 70)
         print("🚀 YouTube Creator Finder for Higgsfield AI")
         print("=" * 70)
@@ -503,70 +2990,405 @@ class YouTubeCreatorFinder:
             print(f"   {tier}: {config['target_count']} creators ({config['percentage']}%)")
         print(f"\n   Total Target: {sum(c['target_count'] for c in TIER_CONFIG.values())} creators")
         print("\n📁 Categories: ", list(CATEGORIES.keys()))
+        if self.quota.budget is not None:
+            self.quota.allocations = self.plan_quota(
+                self.quota.budget - self.quota.total_units, self.category_tier_counts
+            )
+            print(f"\n💰 Quota budget: {self.quota.budget} units")
+            for category_name, units in self.quota.allocations.items():
+                print(f"   {category_name}: {units} units")
         print("=" * 70)
         
-        all_creators = []
+        stream_file = output_file.replace('.csv', '.jsonl')
+        candidates_file = output_file.replace('.csv', '_candidates.jsonl')
+        self.pool.sink = CreatorSink(candidates_file, append=resume)
+        self.save_checkpoint()
         
-        for category_name, category_config in CATEGORIES.items():
-            creators = self.find_creators_for_category(category_name, category_config)
-            all_creators.extend(creators)
-            print(f"\n📊 Running Total: {len(all_creators)} creators")
-            print(f"   Tier Distribution: {self.tier_counts}")
+        try:
+            category_names = [name for name in CATEGORIES.keys() if name not in self.completed_categories]
+            for _ in range(ASSIGNMENT_ROUNDS):
+                self.search_categories(category_names)
+                if self._abort.is_set():
+                    break
+                category_names = self.reopen_short_categories()
+                if not category_names:
+                    break
+                print(f"\n🔁 Assignment left {len(category_names)} categories short, searching their remaining keywords")
+        except KeyboardInterrupt:
+            self.save_checkpoint()
+            self.pool.sink.close()
+            print(f"\n⏸️  Interrupted. {len(self.pool)} candidates saved to {candidates_file}")
+            print("   Run again with --resume to continue where this run stopped.")
+            return None
+        finally:
+            self.save_checkpoint()
+        
+        self.pool.sink.close()
+        self.assign_creators(stream_file)
+        
+        with self.metrics.stage('export'):
+            df, paths = self.export(self.sink.read(), output_file)
+        metrics_file = output_file.replace('.csv', '_metrics.json')
+        self.save_metrics(metrics_file)
+        
+        print("\n" + "=" * 70)
+        print("✅ COMPLETE!")
+        print("=" * 70)
+        self.print_output_files(paths, ("Stream (JSONL)", stream_file), ("Candidates (JSONL)", candidates_file),
+                                ("Metrics (JSON)", metrics_file))
+        print(f"\n📊 Total creators found: {len(df)} (from a pool of {len(self.pool)} candidates)")
+        if self.cache:
+            print(f"💾 Cache: {self.cache.hits} hits, {self.cache.misses} misses")
+        if self.rejections.skips:
+            print(f"🚫 Skipped previously rejected channels: {dict(self.rejections.skips)}")
+        if self.cassette and self.cassette.mode == "record":
+            print(f"📼 Recorded {self.cassette.recorded} API responses to {self.cassette.path}")
+        elif self.cassette:
+            print(f"📼 Replayed {self.cassette.replayed} API responses from {self.cassette.path}")
+            if self.cassette.misses:
+                print(f"   ⚠️  {self.cassette.misses} requests were not in the cassette; their keywords were skipped")
+        
+        self.print_quota_report(df)
+        
+        print()
+        print(self.metrics.summary())
+        
+        if len(df):
+            print("\n📈 Breakdown by Category:")
+            print(df['Content Category'].value_counts().to_string())
+            
+            print("\n📈 Breakdown by Tier:")
+            print(df['Subscriber Category'].value_counts().to_string())
+        
+        if self.completed_categories == set(CATEGORIES.keys()):
+            if os.path.exists(self.checkpoint_path):
+                os.remove(self.checkpoint_path)
+        else:
+            if self.quota_exhausted:
+                print("\n🛑 The API quota ran out before every category finished.")
+            print("\n⏸️  Some categories stopped short (e.g. quota budget). Run again with --resume to continue.")
+        
+        return df
+    
+    @staticmethod
+    def load_creators(path):
+        """Read creators from a previous run's _detailed.csv or .jsonl stream"""
+        if path.endswith('.jsonl'):
+            return list(CreatorSink.read_file(path))
+        df = pd.read_csv(path)
+        if 'Channel ID' not in df.columns:
+            raise ValueError(f"{path} has no 'Channel ID' column; pass a _detailed.csv or .jsonl stream")
+        return df.astype(object).where(df.notna(), None).to_dict('records')
+    
+    def refresh_channel_stats(self, channel_ids):
+        """Re-fetch stats for known channels with conditional requests.
         
-        # Create DataFrame
-        df = pd.DataFrame(all_creators)
+        Each 50-ID batch is sent with the ETag of its last response, stored in the
+        cache together with the records that response held, so an unchanged batch
+        comes back as a 304 and its stored records are used as the current numbers.
+        Without a cache there are no stored ETags and every batch is fetched.
+        
+        Returns ({channel_id: ChannelRecord} for every channel still returned, ids no longer returned, batches unchanged).
+        """
+        def refresh_batch(batch):
+            cache_key = ','.join(batch)
+            stored = self.cache.get('etag', cache_key) if self.cache else None
+            if stored and 'records' not in stored:
+                stored = None  # written before records were stored alongside the ETag
+            response = self._call(
+                "channels.list",
+                if_none_match=stored['etag'] if stored else None,
+                part="statistics,contentDetails",
+                id=cache_key,
+                maxResults=50,
+                fields=REFRESH_FIELDS
+            )
+            if response is None:
+                records = {row[0]: ChannelRecord.from_row(row) for row in stored['records']}
+                return records, set(batch) - set(records), True
+            
+            records = {item['id']: ChannelRecord.from_api(item) for item in response.get('items', [])}
+            if self.cache and response.get('etag'):
+                self.cache.put('etag', cache_key, {
+                    'etag': response['etag'],
+                    'records': [record.to_row() for record in records.values()]
+                })
+            return records, set(batch) - set(records), False
+        
+        channel_ids = sorted(set(channel_ids))
+        batches = [channel_ids[i:i+50] for i in range(0, len(channel_ids), 50)]
+        records, gone, unchanged_batches = {}, set(), 0
+        for batch_records, batch_gone, not_modified in self._map_io(refresh_batch, batches):
+            records.update(batch_records)
+            gone |= batch_gone
+            unchanged_batches += not_modified
+        return records, gone, unchanged_batches
+    
+    def refresh(self, source, output_file):
+        """Update a previous creator list's numbers without a discovery run.
+        
+        Subscribers, tiers and the 'Why this Creator' text are updated in place from
+        conditional channel stats requests; recent videos (and so avg views) are only
+        re-fetched for channels whose videoCount changed. Channels that no longer
+        exist are dropped. Returns the refreshed DataFrame.
+        """
+        start = time.perf_counter()
+        creators = self.load_creators(source)
+        print(f"🔄 Refreshing {len(creators)} creators from {source}")
+        
+        records, gone, unchanged_batches = self.refresh_channel_stats([c['Channel ID'] for c in creators])
+        changed = {
+            c['Channel ID'] for c in creators
+            if c['Channel ID'] in records
+            and (records[c['Channel ID']].subscribers, records[c['Channel ID']].video_count)
+            != (c['Subscribers (Raw)'], c['Video Count'])
+        }
+        new_uploads = {
+            c['Channel ID']: records[c['Channel ID']]
+            for c in creators
+            if c['Channel ID'] in records and records[c['Channel ID']].video_count != c['Video Count']
+        }
+        videos_by_channel = self.get_recent_videos_stats_batch(new_uploads, fresh=True)
+        
+        refreshed = []
+        out_of_range = 0
+        for creator in creators:
+            channel_id = creator['Channel ID']
+            if channel_id in gone:
+                continue
+            if channel_id in records:
+                # Applied even from a 304: the input file may be older than the cached ETag
+                stats = records[channel_id]
+                creator['Subscribers (Raw)'] = stats.subscribers
+                creator['Video Count'] = stats.video_count
+                if channel_id in videos_by_channel and not videos_by_channel[channel_id]['error']:
+                    creator['Avg Views (Raw)'] = videos_by_channel[channel_id]['avg_views']
+                    creator.update(videos_by_channel[channel_id]['analytics'])
+                if self.get_tier_for_subscribers(stats.subscribers) is None:
+                    # score_creators keeps the last tier rather than drop a creator the team may already be talking to
+                    out_of_range += 1
+            refreshed.append(creator)
+        
+        with self.metrics.stage('scoring'):
+            scored = self.score_creators(refreshed)
+        df, paths = self.export(scored, output_file)
+        
+        print(f"\n✅ Refreshed {len(df)} creators in {time.perf_counter() - start:.1f}s")
+        print(f"   Unchanged batches (304): {unchanged_batches}")
+        print(f"   Changed channels: {len(changed)}, recent videos re-fetched for {len(new_uploads)}")
+        if gone:
+            print(f"   Removed {len(gone)} channels that no longer exist")
+        if out_of_range:
+            print(f"   ⚠️  {out_of_range} channels are now outside every tier range and kept their last tier")
+        self.print_output_files(paths)
+        # Refresh calls are not made for any category
+        self.print_quota_report(df, by_category=False)
+        return df
+    
+    def export(self, creators, output_file, formats=None):
+        """Write creators to the simple and detailed CSVs, the Excel workbook and optionally Parquet.
+        
+        Rows (or an already scored DataFrame) are materialized into one DataFrame
+        and every format is written from it.
+        The workbook is streamed in write-only mode, filling the all-creators,
+        per-category and per-tier sheets in a single pass over the rows. Time spent
+        per format is kept in export_timings.
+        
+        Returns the DataFrame and {format: path}.
+        """
+        formats = self.export_formats if formats is None else formats
+        
+        # Create DataFrame from the creators, grouped by category
+        df = creators if isinstance(creators, pd.DataFrame) else pd.DataFrame.from_records(creators)
+        if len(df):
+            category_order = {name: i for i, name in enumerate(CATEGORIES.keys())}
+            df = df.sort_values('Content Category', key=lambda c: c.map(category_order), kind='stable')
         
         # Select and order columns for CSV output (matching creators_table.csv format)
         output_columns = [
             'Channel name', 'Link', 'Subscribers', 'Avg Views',
             'Content Category', 'Subscriber Category', 'Why this Creator'
         ]
-        df_output = df[[col for col in output_columns if col in df.columns]]
+        output_columns = [col for col in output_columns if col in df.columns]
         
-        # Save to CSV
-        df_output.to_csv(output_file, index=False)
+        paths = {}
+        self.export_timings = {}
         
-        # Also save detailed version with all data
-        detailed_file = output_file.replace('.csv', '_detailed.csv')
-        df.to_csv(detailed_file, index=False)
+        def timed(fmt, write):
+            start = time.perf_counter()
+            with self.metrics.stage(f'export_{fmt}'):
+                write()
+            self.export_timings[fmt] = time.perf_counter() - start
         
-        # Save to Excel with formatting
-        excel_file = output_file.replace('.csv', '.xlsx')
-        with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
-            df_output.to_excel(writer, index=False, sheet_name='All Creators')
-            
-            # Create separate sheets per category
-            for category in CATEGORIES.keys():
-                category_df = df_output[df_output['Content Category'] == category]
-                sheet_name = category[:31]  # Excel sheet name limit
-                category_df.to_excel(writer, index=False, sheet_name=sheet_name)
-            
-            # Create sheets per tier
-            for tier in TIER_CONFIG.keys():
-                tier_df = df_output[df_output['Subscriber Category'] == tier]
-                sheet_name = tier.split('(')[0].strip()[:31]
-                tier_df.to_excel(writer, index=False, sheet_name=sheet_name)
+        if 'csv' in formats:
+            paths['csv'] = output_file
+            # Also save detailed version with all data
+            paths['detailed'] = output_file.replace('.csv', '_detailed.csv')
+            timed('csv', lambda: (
+                df.to_csv(paths['csv'], columns=output_columns, index=False),
+                df.to_csv(paths['detailed'], index=False)
+            ))
+        if 'xlsx' in formats:
+            paths['xlsx'] = output_file.replace('.csv', '.xlsx')
+            timed('xlsx', lambda: self._write_workbook(df, output_columns, paths['xlsx']))
+        if 'parquet' in formats:
+            paths['parquet'] = output_file.replace('.csv', '.parquet')
+            timed('parquet', lambda: df.to_parquet(paths['parquet'], index=False))
         
-        print("\n" + "=" * 70)
-        print("✅ COMPLETE!")
-        print("=" * 70)
-        print(f"\n📁 Output Files:")
-        print(f"   CSV (simple): {output_file}")
-        print(f"   CSV (detailed): {detailed_file}")
-        print(f"   Excel: {excel_file}")
-        print(f"\n📊 Total creators found: {len(df)}")
+        return df, paths
+    
+    def _write_workbook(self, df, columns, path):
+        """Stream the workbook: all creators, then one sheet per category and one per tier"""
+        with timing("import openpyxl"):
+            from openpyxl import Workbook
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import Font
         
-        print("\n📈 Breakdown by Category:")
-        print(df['Content Category'].value_counts().to_string())
+        workbook = Workbook(write_only=True)
+        all_sheet = workbook.create_sheet('All Creators')
+        category_sheets = {category: workbook.create_sheet(category[:31]) for category in CATEGORIES.keys()}
+        tier_sheets = {tier: workbook.create_sheet(tier.split('(')[0].strip()[:31]) for tier in TIER_CONFIG.keys()}
         
-        print("\n📈 Breakdown by Tier:")
-        print(df['Subscriber Category'].value_counts().to_string())
+        header_font = Font(bold=True)
+        for sheet in [all_sheet, *category_sheets.values(), *tier_sheets.values()]:
+            header = []
+            for column in columns:
+                cell = WriteOnlyCell(sheet, value=column)
+                cell.font = header_font
+                header.append(cell)
+            sheet.append(header)
         
-        return df
+        if len(df):
+            category_index = columns.index('Content Category')
+            tier_index = columns.index('Subscriber Category')
+            # One pass over the rows partitions them into every sheet
+            for row in df[columns].itertuples(index=False, name=None):
+                all_sheet.append(row)
+                if row[category_index] in category_sheets:
+                    category_sheets[row[category_index]].append(row)
+                if row[tier_index] in tier_sheets:
+                    tier_sheets[row[tier_index]].append(row)
+        
+        workbook.save(path)
+    
+    def print_output_files(self, paths, *extra):
+        """Print every output path and how long each export format took"""
+        labels = {'csv': "CSV (simple)", 'detailed': "CSV (detailed)", 'xlsx': "Excel", 'parquet': "Parquet"}
+        print(f"\n📁 Output Files:")
+        for fmt, path in paths.items():
+            print(f"   {labels[fmt]}: {path}")
+        for label, path in extra:
+            print(f"   {label}: {path}")
+        if self.export_timings:
+            per_format = ", ".join(f"{fmt} {seconds:.2f}s" for fmt, seconds in self.export_timings.items())
+            print(f"⏱️  Export: {sum(self.export_timings.values()):.2f}s ({per_format})")
+    
+    def save_metrics(self, path):
+        """Write latency histograms, error counts and per-keyword yield to a JSON file"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.metrics.to_dict(), f, indent=2)
+    
+    def print_quota_report(self, df, by_category=True):
+        """Print quota units spent per endpoint, per category and per accepted creator"""
+        print(f"\n💰 Quota used: {self.quota.total_units} units")
+        for endpoint, units in self.quota.units_by_endpoint.items():
+            print(f"   {endpoint}: {units} units ({self.quota.calls_by_endpoint[endpoint]} calls)")
+        if len(self.keys.keys) > 1:
+            print(f"\n🔑 Quota by API key ({self.keys.available}/{len(self.keys.keys)} still available):")
+            for key in self.keys.keys:
+                print(f"   ...{key['key'][-4:]}: {key['meter'].total_units} units")
+        if not by_category:
+            return
+        
+        counts = df['Content Category'].value_counts() if len(df) else {}
+        print("\n💰 Quota by Category:")
+        for category_name in CATEGORIES.keys():
+            units = self.quota.units_by_category.get(category_name, 0)
+            creators = int(counts.get(category_name, 0))
+            per_creator = f"{units / creators:.1f}" if creators else "n/a"
+            print(f"   {category_name}: {units} units, {per_creator} units/creator")
 
 
-def main():
-    if not YOUTUBE_API_KEY or YOUTUBE_API_KEY == "":
+COMMANDS = ["run", "refresh", "coordinate", "worker", "search", "index"]
+
+
+def parse_args(argv=None):
+    """Parse the command line; with no subcommand the arguments are those of 'run'"""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or (argv[0] not in COMMANDS and argv[0] not in ('-h', '--help')):
+        argv = ["run", *argv]
+    
+    common = argparse.ArgumentParser(add_help=False)
+    cassette_group = common.add_mutually_exclusive_group()
+    cassette_group.add_argument('--record', metavar='CASSETTE',
+                                help="record every API response to this archive")
+    cassette_group.add_argument('--replay', metavar='CASSETTE',
+                                help="serve API responses from a recorded archive, with no network access")
+    common.add_argument('--key-index', type=int,
+                        help="use only this entry of the configured API keys (one key per worker)")
+    common.add_argument('--profile', metavar='PATH',
+                        help="run under cProfile and write the stats to this file")
+    common.add_argument('--timing', action='store_true',
+                        help="print how long startup phases and lazy imports took")
+    common.add_argument('--window-videos', type=int, default=RECENT_VIDEOS_PER_CHANNEL,
+                        help="newest uploads per channel in the recent-video analytics (0: no limit)")
+    common.add_argument('--window-days', type=int, default=RECENT_VIDEOS_MAX_AGE_DAYS or 0,
+                        help="only analyze uploads from the last N days (0: any age)")
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument('--output', help="output CSV path (default: timestamped file)")
+    output.add_argument('--parquet', action='store_true',
+                        help="also write the detailed output as Parquet (requires pyarrow)")
+    
+    parser = argparse.ArgumentParser(description="Find YouTube creators for Higgsfield AI partnerships")
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND')
+    run_parser = commands.add_parser('run', parents=[common, output],
+                                     help="search every category and export the creators (default)")
+    run_parser.add_argument('--resume', action='store_true',
+                            help=f"continue the last interrupted run from {CHECKPOINT_PATH}")
+    refresh_parser = commands.add_parser('refresh', parents=[common, output],
+                                         help="update the numbers of a previous run's creators instead of searching")
+    refresh_parser.add_argument('previous', metavar='PREVIOUS', help="a previous _detailed.csv or .jsonl stream")
+    coordinate_parser = commands.add_parser('coordinate', parents=[common, output],
+                                            help="queue every keyword in a shared SQLite store for workers, then merge")
+    coordinate_parser.add_argument('store', metavar='STORE')
+    coordinate_parser.add_argument('--processes', type=int, default=0,
+                                   help="worker processes to start on this machine")
+    worker_parser = commands.add_parser('worker', parents=[common],
+                                        help="process keyword units from a coordinator's shared store")
+    worker_parser.add_argument('store', metavar='STORE')
+    search_parser = commands.add_parser('search', parents=[common],
+                                        help="probe one keyword: print the channels a search returns")
+    search_parser.add_argument('query')
+    search_parser.add_argument('--max-results', type=int, default=KEYWORD_PAGE_SIZE)
+    search_parser.add_argument('--local', action='store_true',
+                               help=f"search the local channel index ({INDEX_PATH}) instead of the API")
+    commands.add_parser('index', parents=[common],
+                        help=f"add every channel in the API cache to the local channel index ({INDEX_PATH})")
+    return parser.parse_args(argv)
+
+
+def print_timings():
+    print("\n⏱️  Startup and command timing:")
+    for phase, seconds in TIMINGS.items():
+        print(f"   {phase:<28} {seconds * 1000:>9.1f} ms")
+    print(f"   {'total since start':<28} {(time.perf_counter() - STARTUP) * 1000:>9.1f} ms")
+
+
+def main(argv=None):
+    TIMINGS["import script"] = time.perf_counter() - STARTUP
+    with timing("parse arguments"):
+        args = parse_args(argv)
+    try:
+        command(args)
+    finally:
+        if args.timing:
+            print_timings()
+
+
+def command(args):
+    """Run one parsed subcommand"""
+    api_keys = [key for key in [YOUTUBE_API_KEY, *YOUTUBE_API_KEYS] if key]
+    if not api_keys and not args.replay:
         print("❌ ERROR: Please set your YouTube API key!")
         print("\n📋 How to get an API key:")
         print("1. Go to: https://console.cloud.google.com/")
@@ -577,13 +3399,79 @@ def main():
         print("6. Click 'Create Credentials' > 'API Key'")
         print("7. Copy the key and paste it in this script (YOUTUBE_API_KEY variable)")
         return
+    key_count = len(api_keys)
+    if args.key_index is not None and api_keys:
+        api_keys = [api_keys[args.key_index % key_count]]
+    
+    # Cassette sessions bypass the cache and the local channel index: a recording must
+    # capture every response, and a replay must see exactly the recorded ones
+    cache = None
+    cassette = None
+    index = None
+    with timing("open cache"):
+        if args.record:
+            cassette = Cassette(args.record, mode="record")
+        elif args.replay:
+            cassette = Cassette(args.replay, mode="replay")
+        else:
+            cache = ApiCache(CACHE_PATH)
+            index = ChannelIndex(INDEX_PATH)
+    with timing("create finder"):
+        window = AnalyticsWindow(args.window_videos or None, args.window_days or None)
+        finder = YouTubeCreatorFinder(api_keys, cache=cache, quota_budget=QUOTA_BUDGET, backend=API_BACKEND,
+                                      cassette=cassette, window=window, index=index)
     
-    finder = YouTubeCreatorFinder(YOUTUBE_API_KEY)
+    if getattr(args, 'parquet', False):
+        finder.export_formats.append("parquet")
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = f"higgsfield_creators_{timestamp}.csv"
+    output_file = getattr(args, 'output', None) or f"higgsfield_creators_{timestamp}.csv"
     
-    df = finder.run(output_file)
+    store = SharedStore(args.store) if args.command in ("coordinate", "worker") else None
+    profiler = cProfile.Profile() if args.profile else None
+    df = None
+    try:
+        if profiler:
+            profiler.enable()
+        with timing(f"command {args.command}"):
+            if args.command == "worker":
+                finder.work(store, f"{socket.gethostname()}-{os.getpid()}")
+            elif args.command == "coordinate":
+                df = finder.coordinate(store, output_file, processes=args.processes, key_count=key_count)
+            elif args.command == "refresh":
+                df = finder.refresh(args.previous, output_file)
+            elif args.command == "search":
+                if args.local:
+                    channels = [c for page in finder.local_pages(args.query) for c in page][:args.max_results]
+                else:
+                    channels = finder.search_channels(args.query, max_results=args.max_results)
+                for channel in channels:
+                    print(f"{channel.channel_id}\t{channel.channel_name}")
+            elif args.command == "index":
+                if index is None:
+                    print("❌ The local channel index is not used with --record or --replay")
+                else:
+                    print(f"📚 {finder.index_cache()} channels in {INDEX_PATH}")
+            else:
+                df = finder.run(output_file, resume=args.resume)
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            print(f"\n🔬 Profile written to {args.profile} (top functions by cumulative time):")
+            pstats.Stats(profiler).sort_stats('cumulative').print_stats(15)
+        finder.close()
+        if store:
+            store.close()
+        if cache:
+            cache.close()
+        if index is not None:
+            index.close()
+        if cassette:
+            cassette.close()
+    
+    if df is None:
+        return
     
     print("\n🎯 Next steps:")
     print("1. Review the CSV and refine 'Why This Creator' column manually")